@@ -55,6 +55,14 @@ class VideoConfig:
     show_object_detections: bool = True
     show_detection_confidence: bool = True
     show_detection_class: bool = True
+    
+    # Web UI streaming settings
+    binary_frames: bool = True  # Send raw JPEG bytes instead of base64 JSON
+    stream_width: int = 640  # Frames wider than this are downscaled before encoding
+    batch_interval: float = 0.0  # Seconds; > 0 coalesces data and video emits to one of each per interval
+    socketio_async_mode: Optional[str] = None  # 'eventlet' or 'threading'; None = auto
+    gpu_jpeg_encode: bool = False  # nvJPEG via torch; imports torch at startup and uploads each CPU frame
+    opencl_stream_resize: bool = False  # Downscale/encode through cv2.UMat (OpenCL T-API) when available
 
 
 @dataclass
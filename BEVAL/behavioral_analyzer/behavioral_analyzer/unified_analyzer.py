@@ -105,6 +105,17 @@ class UnifiedBehavioralAnalyzer:
             print(f"Error starting analysis: {e}")
             return False
     
+    def process_frame_light(self) -> bool:
+        """Advance the camera by one frame without decoding or analyzing it."""
+        if not self.is_running:
+            return False
+        
+        try:
+            return self.cap.grab()
+        except Exception as e:
+            print(f"Error grabbing frame: {e}")
+            return False
+    
     def process_frame(self) -> Tuple[bool, Optional[np.ndarray]]:
         """Process a single frame and return annotated frame."""
         if not self.is_running:
@@ -467,9 +478,8 @@ class UnifiedBehavioralAnalyzer:
     
     def _format_duration(self, seconds: float) -> str:
         """Format duration in HH:MM:SS format."""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
+        minutes, secs = divmod(max(int(seconds), 0), 60)
+        hours, minutes = divmod(minutes, 60)
         return f"{hours:02d}:{minutes:02d}:{secs:02d}"
     
     def stop_analysis(self):
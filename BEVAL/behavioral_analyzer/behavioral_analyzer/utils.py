@@ -133,9 +133,8 @@ class DataCollector:
     
     def _format_duration(self, seconds: float) -> str:
         """Format duration in HH:MM:SS format."""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
+        minutes, secs = divmod(max(int(seconds), 0), 60)
+        hours, minutes = divmod(minutes, 60)
         return f"{hours:02d}:{minutes:02d}:{secs:02d}"
     
     def save_to_file(self, filename: str) -> str:
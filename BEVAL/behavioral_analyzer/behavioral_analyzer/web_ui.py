@@ -8,19 +8,213 @@ behavioral analysis results including video, audio, and object detection data.
 import json
 import time
 import threading
+import queue
 import os
 import socket
+import inspect
+import operator
+from collections import Counter, deque
+from functools import partial
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional
-from flask import Flask, render_template, jsonify, request
-from flask_socketio import SocketIO, emit
+from flask import Flask, Response, render_template, jsonify, request
+from flask_socketio import SocketIO, emit, join_room
 import cv2
-import base64
+from binascii import b2a_base64
 import numpy as np
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from .config import Config
 from .unified_analyzer import UnifiedBehavioralAnalyzer
 
 
+if ORJSON_AVAILABLE:
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    
+    def _orjson_default(obj):
+        """Fallback for values orjson cannot serialize natively (e.g. non-contiguous arrays)."""
+        if isinstance(obj, np.ndarray):
+            return obj.tolist()
+        if hasattr(obj, 'item'):
+            return obj.item()
+        raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+    
+    def _orjson_dumps(obj) -> bytes:
+        """Serialize analyzer data, including numpy values, to JSON bytes."""
+        return orjson.dumps(obj, default=_orjson_default, option=_ORJSON_OPTIONS)
+    
+    class _OrjsonSocketIOJSON:
+        """json-module shim so Socket.IO packets are encoded with orjson."""
+        
+        @staticmethod
+        def dumps(obj, *args, **kwargs) -> str:
+            return _orjson_dumps(obj).decode('utf-8')
+        
+        @staticmethod
+        def loads(s, *args, **kwargs):
+            return orjson.loads(s)
+
+
+def _create_gpu_jpeg_encoder(quality: int):
+    """
+    Build a CUDA JPEG encoder backed by nvJPEG through torchvision.
+    
+    Returns:
+        A function mapping a BGR frame to a uint8 JPEG buffer, or None if CUDA encoding is unavailable
+    """
+    try:
+        import torch
+        from torchvision.io import encode_jpeg
+    except ImportError:
+        return None
+    if not torch.cuda.is_available():
+        return None
+    
+    def encode(frame: np.ndarray) -> np.ndarray:
+        # Upload, convert BGR HWC -> RGB CHW on the device, and bring back only the JPEG bytes
+        tensor = torch.from_numpy(frame).to('cuda')
+        tensor = tensor.flip(-1).permute(2, 0, 1).contiguous()
+        return encode_jpeg(tensor, quality=quality).cpu().numpy()
+    
+    try:
+        # Probe once so an unsupported torchvision/CUDA build falls back to OpenCV up front
+        encode(np.zeros((8, 8, 3), dtype=np.uint8))
+    except Exception as e:
+        print(f"GPU JPEG encoding unavailable, using OpenCV: {e}")
+        return None
+    return encode
+
+
+# A client whose last frame is still unacknowledged after this long gets frames again
+_FRAME_ACK_TIMEOUT = 1.0
+
+# Narrowest stream width a client may request
+_MIN_STREAM_WIDTH = 160
+
+# Clients in this room get only the changed sections of each data update
+_DATA_DELTA_ROOM = 'data_delta'
+_DATA_SECTIONS = ('video', 'audio', 'objects', 'session_stats')
+
+# Numeric scores (0-100) for the dashboard's categorical states
+_ATTENTION_SCORES = MappingProxyType({
+    'Focused': 90.0,
+    'Partially Focused': 60.0,
+    'Distracted': 30.0,
+    'Unknown': None
+})
+_FATIGUE_SCORES = MappingProxyType({
+    'Normal': 20.0,
+    'Mild': 40.0,
+    'Moderate': 60.0,
+    'Severe': 80.0
+})
+_CONFIDENCE_SCORES = MappingProxyType({"low": 0.3, "medium": 0.6, "high": 0.9})
+
+# (attribute, default) pairs read from the video analyzer on every data tick
+_VIDEO_STATE_ATTRS = (
+    ('current_emotion', 'Unknown'),
+    ('emotion_scores', None),
+    ('attention_state', 'Unknown'),
+    ('posture_state', 'Unknown'),
+    ('movement_level', 'Unknown'),
+    ('fatigue_level', 'Normal'),
+    ('blink_count', 0),
+    ('last_reset_time', None),
+    ('total_blink_count', 0),
+    ('performance_tracker', None),
+    ('main_person', None),
+    ('current_detections', None),
+    ('ear_values', None),
+    ('blink_duration', None),
+    ('blink_intervals', None),
+    ('left_ear_values', None),
+    ('right_ear_values', None),
+    ('drowsiness_frames', None),
+    ('object_detector', None),
+)
+_VIDEO_STATE_GETTER = operator.attrgetter(*(name for name, _ in _VIDEO_STATE_ATTRS))
+
+
+def _snapshot_attrs(obj, getter: operator.attrgetter, attrs: tuple) -> tuple:
+    """Read several attributes in one C call, falling back to per-attribute defaults."""
+    try:
+        return getter(obj)
+    except AttributeError:
+        return tuple(getattr(obj, name, default) for name, default in attrs)
+
+
+# eventlet releases whose private RFC6455WebSocket._pack_message(self, message, ...) the
+# deflate patch below was written against (permessage-deflate arrived in 0.25)
+_EVENTLET_DEFLATE_PATCH_VERSIONS = ((0, 25), (1, 0))
+
+
+def _skip_deflate_for_binary_frames():
+    """
+    Keep permessage-deflate for text WebSocket frames but skip it for binary ones.
+    
+    Socket.IO sends JSON events as text frames and JPEG attachments as binary frames.
+    eventlet compresses every frame once a browser negotiates permessage-deflate, which
+    burns CPU on already-compressed JPEG data. Neither eventlet nor engine.io offers a
+    per-message compression option, so this wraps eventlet's private frame packer; any
+    eventlet outside the known versions, or with a different packer, is left untouched.
+    """
+    try:
+        import eventlet
+        from eventlet import websocket
+    except ImportError:
+        return
+    
+    try:
+        version = tuple(int(part) for part in eventlet.__version__.split('.')[:2])
+    except (AttributeError, ValueError):
+        version = None
+    low, high = _EVENTLET_DEFLATE_PATCH_VERSIONS
+    socket_class = getattr(websocket, 'RFC6455WebSocket', None)
+    pack_message = getattr(socket_class, '_pack_message', None)
+    if version is None or not low <= version < high or not callable(pack_message):
+        print("Binary WebSocket frames keep permessage-deflate (unsupported eventlet version)")
+        return
+    try:
+        params = list(inspect.signature(pack_message).parameters)
+    except (TypeError, ValueError):
+        params = []
+    if params[:2] != ['self', 'message']:
+        print("Binary WebSocket frames keep permessage-deflate (unexpected eventlet frame packer)")
+        return
+    if getattr(socket_class, '_binary_deflate_skipped', False):
+        return
+    
+    def _pack_message(self, message, *args, **kwargs):
+        extensions = getattr(self, 'extensions', None)
+        if isinstance(message, (bytes, bytearray)) and extensions and extensions.get('permessage-deflate'):
+            # Hide the extension while packing this frame; packing never yields to other greenlets
+            self.extensions = {k: v for k, v in extensions.items() if k != 'permessage-deflate'}
+            try:
+                return pack_message(self, message, *args, **kwargs)
+            finally:
+                self.extensions = extensions
+        return pack_message(self, message, *args, **kwargs)
+    
+    socket_class._pack_message = _pack_message
+    socket_class._binary_deflate_skipped = True
+
+
+def _select_async_mode() -> str:
+    """
+    Pick the Socket.IO server for this platform: eventlet on Unix, threading on Windows.
+    
+    gevent is not used on Windows: the capture, emit and batch workers call socketio.emit
+    from native threads, which gevent's hub cannot safely serve without monkey-patching.
+    """
+    return 'threading' if os.name == 'nt' else 'eventlet'
+
+
 class BehavioralWebUI:
     """
     Web-based dashboard for real-time behavioral analysis monitoring.
@@ -81,9 +275,12 @@ class BehavioralWebUI:
                         template_folder=template_folder,
                         static_folder=static_folder)
         self.app.config['SECRET_KEY'] = 'behavioral_analyzer_secret_key'
-        # Use threading mode on Windows, eventlet on Unix
-        async_mode = 'threading' if os.name == 'nt' else 'eventlet'
-        self.socketio = SocketIO(self.app, cors_allowed_origins="*", async_mode=async_mode)
+        async_mode = config.video.socketio_async_mode or _select_async_mode()
+        if async_mode == 'eventlet':
+            _skip_deflate_for_binary_frames()
+        socketio_options = {'json': _OrjsonSocketIOJSON} if ORJSON_AVAILABLE else {}
+        self.socketio = SocketIO(self.app, cors_allowed_origins="*", async_mode=async_mode,
+                                 **socketio_options)
         
         # Data storage
         self.latest_data = {
@@ -93,16 +290,65 @@ class BehavioralWebUI:
             'session_stats': {},
             'timestamp': time.time()
         }
+        # With orjson, latest_data holds each section as a pre-serialized orjson Fragment;
+        # section name -> (JSON bytes, Fragment) of the latest collection
+        self._section_fragments = {}
+        self._config_cache_bytes = None  # Serialized /api/config payload
         
         # Statistics tracking
         self.emotion_history = []
-        self.attention_scores = []
+        self.attention_scores = deque(maxlen=100)  # Last 100 scores
+        self._attention_sum = 0.0  # Running sum of attention_scores
         self.previous_emotion = None
         self.emotion_change_count = 0
         
         # Video streaming
         self.video_streaming = False
         self.video_thread = None
+        # JPEG encoder settings are fixed for the session, so build them once
+        self._jpeg_params = [
+            cv2.IMWRITE_JPEG_QUALITY, 80,
+            cv2.IMWRITE_JPEG_OPTIMIZE, 0,
+            cv2.IMWRITE_JPEG_PROGRESSIVE, 0
+        ]
+        self._gpu_encoder = _create_gpu_jpeg_encoder(80) if config.video.gpu_jpeg_encode else None
+        # OpenCV's T-API runs resize on an OpenCL device when one is present
+        self._use_opencl = bool(config.video.opencl_stream_resize and cv2.ocl.haveOpenCL())
+        if self._use_opencl:
+            cv2.ocl.setUseOpenCL(True)
+        # New frames are handed to the streamer through a small drop-oldest queue
+        self.frame_queue = queue.Queue(maxsize=2)
+        self.frame_seq = 0
+        # Default width streamed frames are downscaled to; the analyzer keeps full resolution
+        self.stream_width = config.video.stream_width or 640
+        # Encoding runs on a small pool; the emitter sends finished frames in order
+        self._encoder_pool = None
+        self._encoder_local = threading.local()
+        self._encoded_queue = queue.Queue(maxsize=4)
+        self.video_emit_thread = None
+        
+        # Optional emit batching: data and the newest frame go out once per batch interval
+        self.batch_interval = config.video.batch_interval
+        self._pending_frame = None
+        self.batch_thread = None
+        
+        # Clients that asked for video (sid -> stream width), and when each was sent a
+        # still-unacknowledged frame
+        self._video_subscribers = {}
+        self._pending_acks = {}
+        
+        # Delta data updates: last emitted snapshot and the clients that merge deltas
+        self._last_emitted_data = None
+        self._delta_clients = set()
+        
+        # Pipeline instrumentation: recent stage timings (ms) and event counters
+        self._metrics = {
+            'process_ms': deque(maxlen=100),
+            'encode_ms': deque(maxlen=100),
+            'emit_ms': deque(maxlen=100),
+            'collect_ms': deque(maxlen=100),
+        }
+        self._metric_counts = Counter()
         
         # Frame processing
         self.frame_processing_active = False
@@ -135,17 +381,29 @@ class BehavioralWebUI:
         @self.app.route('/api/data')
         def get_data():
             """Get current analysis data."""
-            return jsonify(self.latest_data)
+            if ORJSON_AVAILABLE:
+                # The sections are already serialized; this only joins them
+                response = Response(_orjson_dumps(self.latest_data), mimetype='application/json')
+            else:
+                response = jsonify(self.latest_data)
+            # Live data must never be served from a cache
+            response.headers['Cache-Control'] = 'no-store'
+            return response
         
         @self.app.route('/api/config')
         def get_config():
             """Get current configuration."""
-            return jsonify({
-                'video_enabled': self.config.video.enable_emotion,
-                'audio_enabled': self.config.audio.enable_transcription,
-                'object_detection_enabled': self.config.video.enable_object_detection,
-                'debug_mode': self.config.video.debug_mode
-            })
+            payload = self._config_cache_bytes
+            if payload is None:
+                payload = self._rebuild_config_cache()
+            return Response(payload, mimetype='application/json')
+        
+        @self.app.route('/api/metrics')
+        def get_metrics():
+            """Get streaming pipeline timings, drop counts and queue depths."""
+            response = jsonify(self._metrics_snapshot())
+            response.headers['Cache-Control'] = 'no-store'
+            return response
         
         @self.app.route('/api/controls', methods=['POST'])
         def update_controls():
@@ -161,8 +419,47 @@ class BehavioralWebUI:
             if 'show_objects' in data:
                 self.config.video.show_object_detections = data['show_objects']
             
+            self._config_cache_bytes = None
             return jsonify({'status': 'success'})
     
+    def _metrics_snapshot(self) -> Dict[str, Any]:
+        """Summarize the pipeline metrics as p50/p95/p99 latencies, counters and queue depths."""
+        latencies = {}
+        for name, samples in self._metrics.items():
+            values = list(samples)
+            if values:
+                p50, p95, p99 = np.percentile(values, [50, 95, 99])
+                latencies[name] = {'count': len(values), 'p50': round(float(p50), 2),
+                                   'p95': round(float(p95), 2), 'p99': round(float(p99), 2),
+                                   'max': round(max(values), 2)}
+            else:
+                latencies[name] = {'count': 0}
+        return {
+            'latency_ms': latencies,
+            'counters': dict(self._metric_counts),
+            'queue_depth': {
+                'frames': self.frame_queue.qsize(),
+                'encoded': self._encoded_queue.qsize(),
+            },
+            'video_subscribers': len(self._video_subscribers),
+            'timestamp': time.time()
+        }
+    
+    def _rebuild_config_cache(self) -> bytes:
+        """Serialize the /api/config payload and keep it until the controls change."""
+        config_data = {
+            'video_enabled': self.config.video.enable_emotion,
+            'audio_enabled': self.config.audio.enable_transcription,
+            'object_detection_enabled': self.config.video.enable_object_detection,
+            'debug_mode': self.config.video.debug_mode
+        }
+        if ORJSON_AVAILABLE:
+            payload = _orjson_dumps(config_data)
+        else:
+            payload = json.dumps(config_data).encode('utf-8')
+        self._config_cache_bytes = payload
+        return payload
+    
     def _setup_socketio_events(self):
         """Setup SocketIO events."""
         
@@ -176,22 +473,36 @@ class BehavioralWebUI:
         def handle_disconnect():
             """Handle client disconnection."""
             print(f"Client disconnected: {request.sid}")
+            self._video_subscribers.pop(request.sid, None)
+            self._pending_acks.pop(request.sid, None)
+            self._delta_clients.discard(request.sid)
         
         @self.socketio.on('request_data')
         def handle_data_request():
             """Handle data request from client."""
             emit('data_update', self.latest_data)
         
+        @self.socketio.on('subscribe_data_delta')
+        def handle_delta_subscribe():
+            """Switch this client to 'data_delta' events, starting from a full snapshot."""
+            join_room(_DATA_DELTA_ROOM)
+            self._delta_clients.add(request.sid)
+            emit('data_update', self.latest_data)
+        
         @self.socketio.on('toggle_video_stream')
         def handle_video_toggle(data):
-            """Toggle video streaming."""
-            self.video_streaming = data.get('enabled', False)
-            if self.video_streaming and not self.video_thread:
-                self._start_video_stream()
-            elif not self.video_streaming and self.video_thread:
-                self._stop_video_stream()
+            """Subscribe or unsubscribe this client from the video stream."""
+            enabled = data.get('enabled', False)
+            if enabled:
+                self._video_subscribers[request.sid] = self._client_stream_width(data.get('stream_width'))
+                if not self.video_thread:
+                    self.video_streaming = True
+                    self._start_video_stream()
+            else:
+                self._video_subscribers.pop(request.sid, None)
+                self._pending_acks.pop(request.sid, None)
             
-            emit('status', {'message': f'Video streaming {"enabled" if self.video_streaming else "disabled"}'})
+            emit('status', {'message': f'Video streaming {"enabled" if enabled else "disabled"}'})
         
         @self.socketio.on('update_controls')
         def handle_update_controls(data):
@@ -212,55 +523,249 @@ class BehavioralWebUI:
                     self.config.video.show_object_detections = data['show_objects']
                     print(f"Show objects: {data['show_objects']}")
                 
+                self._config_cache_bytes = None
                 emit('status', {'message': 'Controls updated successfully'})
             except Exception as e:
                 print(f"Error updating controls: {e}")
                 emit('status', {'message': f'Error updating controls: {str(e)}'})
     
+    def _client_stream_width(self, value) -> int:
+        """Validate a client's requested stream width, falling back to the configured one."""
+        if not isinstance(value, int) or isinstance(value, bool) or value <= 0:
+            return self.stream_width
+        # Widths at or above the camera's are streamed unscaled (see _plan_downscale)
+        return max(_MIN_STREAM_WIDTH, value)
+    
     def _start_video_stream(self):
-        """Start video streaming thread."""
+        """Start video streaming threads."""
         if self.analyzer and hasattr(self.analyzer, 'video_analyzer'):
+            self._encoder_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='jpeg-encoder')
             self.video_thread = threading.Thread(target=self._video_stream_worker, daemon=True)
+            self.video_emit_thread = threading.Thread(target=self._video_emit_worker, daemon=True)
             self.video_thread.start()
+            self.video_emit_thread.start()
     
     def _stop_video_stream(self):
-        """Stop video streaming thread."""
+        """Stop video streaming threads."""
         self.video_streaming = False
         if self.video_thread:
             self.video_thread.join(timeout=1.0)
             self.video_thread = None
+        if self.video_emit_thread:
+            self.video_emit_thread.join(timeout=1.0)
+            self.video_emit_thread = None
+        if self._encoder_pool:
+            self._encoder_pool.shutdown(wait=False, cancel_futures=True)
+            self._encoder_pool = None
     
     def _video_stream_worker(self):
-        """Video streaming worker thread."""
+        """Video streaming worker thread (submits each new frame to the encoder pool once)."""
         while self.video_streaming and self.analyzer:
             try:
-                # Get current frame from analyzer
-                if hasattr(self.analyzer, 'video_analyzer') and hasattr(self.analyzer.video_analyzer, 'current_frame'):
-                    frame = self.analyzer.video_analyzer.current_frame
-                    if frame is not None and frame.size > 0:
-                        # Encode frame as JPEG
-                        _, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 80])
-                        if buffer is not None:
-                            frame_base64 = base64.b64encode(buffer).decode('utf-8')
-                            
-                            # Emit frame to all connected clients
-                            self.socketio.emit('video_frame', {
-                                'frame': frame_base64,
-                                'timestamp': time.time()
-                            })
+                # Block until the frame processor publishes a new frame
+                try:
+                    seq, frame = self.frame_queue.get(timeout=0.5)
+                except queue.Empty:
+                    continue
                 
-                time.sleep(0.033)  # ~30 FPS
+                # Nobody is watching, so don't spend time encoding
+                if not self._video_subscribers:
+                    continue
+                
+                if frame is not None and frame.size > 0:
+                    # One encode per distinct requested width
+                    widths = frozenset(self._video_subscribers.values())
+                    future = self._encoder_pool.submit(self._encode_frame, frame, widths)
+                    if self._put_latest(self._encoded_queue, (seq, future)):
+                        self._metric_counts['encoded_frames_dropped'] += 1
             except Exception as e:
                 print(f"Video streaming error: {e}")
                 import traceback
                 traceback.print_exc()
                 time.sleep(0.1)
     
+    def _video_emit_worker(self):
+        """Emit encoded frames in submission order while the pool encodes the next ones."""
+        last_seq = 0
+        while self.video_streaming and self.analyzer:
+            try:
+                try:
+                    seq, future = self._encoded_queue.get(timeout=0.5)
+                except queue.Empty:
+                    continue
+                
+                payloads = future.result()
+                # Drop frames that finished after a newer one was already sent
+                if not payloads or seq <= last_seq:
+                    self._metric_counts['stale_frames_dropped'] += 1
+                    continue
+                last_seq = seq
+                
+                if self.batch_interval:
+                    # The batch worker sends it with the next batch
+                    self._pending_frame = payloads
+                else:
+                    t0 = time.perf_counter()
+                    self._emit_frame(payloads)
+                    self._metrics['emit_ms'].append((time.perf_counter() - t0) * 1000)
+            except Exception as e:
+                print(f"Video emit error: {e}")
+                import traceback
+                traceback.print_exc()
+                time.sleep(0.1)
+    
+    def _emit_frame(self, payloads):
+        """Send each subscriber that has acknowledged its previous frame the encoding for its width.
+        
+        Args:
+            payloads: Encoded frames keyed by stream width (see _encode_frame)
+        """
+        binary = self.config.video.binary_frames
+        timestamp = time.time()
+        now = time.monotonic()
+        for sid, width in list(self._video_subscribers.items()):
+            payload = payloads.get(width)
+            if payload is None:
+                # Subscribed or resized after this frame was encoded; the next one covers it
+                continue
+            sent_at = self._pending_acks.get(sid)
+            if sent_at is not None and now - sent_at < _FRAME_ACK_TIMEOUT:
+                # Still displaying the previous frame; pushing more would only queue up lag
+                self._metric_counts['frames_skipped_awaiting_ack'] += 1
+                continue
+            self._pending_acks[sid] = now
+            if binary:
+                # Raw JPEG bytes travel as a binary WebSocket frame
+                event, data = 'video_frame_bin', payload
+            else:
+                event, data = 'video_frame', {'frame': payload, 'timestamp': timestamp}
+            self.socketio.emit(event, data, to=sid, callback=partial(self._frame_acked, sid))
+    
+    def _frame_acked(self, sid, *args):
+        """Ack callback: the client has displayed its frame and can take the next one."""
+        self._pending_acks.pop(sid, None)
+    
+    def _encode_frame(self, frame: np.ndarray, widths):
+        """Encode a frame once per stream width.
+        
+        Returns:
+            Dict of width -> JPEG bytes (base64 string when binary frames are off);
+            widths that failed to encode are left out
+        """
+        t0 = time.perf_counter()
+        try:
+            payloads = {}
+            # Widths at or above the frame's all stream it unscaled, so share that encoding
+            full_width = frame.shape[1]
+            for width in sorted(widths):
+                key = min(width, full_width)
+                if key not in payloads:
+                    payloads[key] = self._encode_frame_impl(frame, key)
+                payloads[width] = payloads[key]
+            return {width: payloads[width] for width in widths if payloads[width] is not None}
+        finally:
+            self._metrics['encode_ms'].append((time.perf_counter() - t0) * 1000)
+    
+    def _encode_frame_impl(self, frame: np.ndarray, stream_w: int):
+        """Downscale and JPEG-encode a frame at one stream width (see _encode_frame)."""
+        frame = self._downscale_for_stream(frame, stream_w)
+        
+        buffer = None
+        # (OpenCL-resized frames arrive as cv2.UMat and go straight to imencode)
+        if (self._gpu_encoder is not None and isinstance(frame, np.ndarray)
+                and frame.ndim == 3 and frame.shape[2] == 3):
+            try:
+                buffer = self._gpu_encoder(frame)
+            except Exception as e:
+                print(f"GPU JPEG encoding failed, falling back to OpenCV: {e}")
+                self._gpu_encoder = None
+        if buffer is None:
+            ok, buffer = cv2.imencode('.jpg', frame, self._jpeg_params)
+            if not ok:
+                return None
+        
+        if self.config.video.binary_frames:
+            return buffer.tobytes()
+        # binascii is the C routine behind base64; reading the buffer directly skips a bytes copy
+        return b2a_base64(buffer, newline=False).decode('ascii')
+    
+    def _downscale_for_stream(self, frame: np.ndarray, stream_w: int):
+        """Shrink a frame to a stream width using buffers specialized for its shape.
+        
+        The camera resolution is fixed for a session, so each encoder thread works out the
+        target size and destination buffer once per width and only re-plans when the shape changes.
+        """
+        plans = getattr(self._encoder_local, 'plans', None)
+        if plans is None:
+            plans = self._encoder_local.plans = {}
+        plan_key = (frame.shape, frame.dtype, stream_w)
+        plan = plans.get(plan_key)
+        if plan is None:
+            if len(plans) >= 8:
+                # Clients come and go with different widths; don't hold buffers for all of them
+                plans.clear()
+            plan = plans[plan_key] = self._plan_downscale(frame, stream_w)
+        
+        dsize, resize_buf = plan
+        if dsize is None:
+            return frame
+        src = cv2.UMat(frame) if self._use_opencl else frame
+        return cv2.resize(src, dsize, dst=resize_buf, interpolation=cv2.INTER_AREA)
+    
+    def _plan_downscale(self, frame: np.ndarray, stream_w: int):
+        """Work out the stream size and resize buffer for an input shape and stream width.
+        
+        Returns:
+            (dsize, resize_buf), or (None, None) when the frame is already narrow enough
+        """
+        height, width = frame.shape[:2]
+        if width <= stream_w:
+            return None, None
+        
+        stream_h = max(1, int(height * stream_w / width))
+        if self._use_opencl:
+            # Device-side destination; imencode reads the UMat directly
+            mat_type = cv2.CV_8UC(frame.shape[2] if frame.ndim == 3 else 1)
+            resize_buf = cv2.UMat(stream_h, stream_w, mat_type)
+        else:
+            resize_buf = np.empty((stream_h, stream_w) + frame.shape[2:], dtype=frame.dtype)
+        return (stream_w, stream_h), resize_buf
+    
+    @staticmethod
+    def _put_latest(target_queue: queue.Queue, item) -> bool:
+        """Put an item on a bounded queue, discarding the oldest entry when it is full.
+        
+        Returns:
+            True if an entry was discarded to make room
+        """
+        try:
+            target_queue.put_nowait(item)
+            return False
+        except queue.Full:
+            try:
+                target_queue.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                target_queue.put_nowait(item)
+            except queue.Full:
+                pass
+            return True
+    
+    def _publish_frame(self, frame: np.ndarray):
+        """Queue a new frame for streaming, dropping the oldest one if the streamer lags."""
+        self.frame_seq += 1
+        if self._put_latest(self.frame_queue, (self.frame_seq, frame)):
+            self._metric_counts['frames_dropped'] += 1
+    
     def _start_data_collection(self):
         """Start data collection thread."""
         self.data_thread_active = True
         self.data_thread = threading.Thread(target=self._data_collection_worker, daemon=True)
         self.data_thread.start()
+        if self.batch_interval:
+            self.batch_thread = threading.Thread(target=self._emit_batch_worker, daemon=True)
+            self.batch_thread.start()
     
     def _stop_data_collection(self):
         """Stop data collection thread."""
@@ -268,36 +773,22 @@ class BehavioralWebUI:
         if self.data_thread:
             self.data_thread.join(timeout=1.0)
             self.data_thread = None
-    
-    def _attention_state_to_score(self, attention_state: str) -> Optional[float]:
-        """Convert attention state to numeric score (0-100)."""
-        attention_map = {
-            'Focused': 90.0,
-            'Partially Focused': 60.0,
-            'Distracted': 30.0,
-            'Unknown': None
-        }
-        return attention_map.get(attention_state, None)
-    
-    def _fatigue_level_to_score(self, fatigue_level: str) -> float:
-        """Convert fatigue level to numeric score (0-100)."""
-        fatigue_map = {
-            'Normal': 20.0,
-            'Mild': 40.0,
-            'Moderate': 60.0,
-            'Severe': 80.0
-        }
-        return fatigue_map.get(fatigue_level, 20.0)
+        if self.batch_thread:
+            self.batch_thread.join(timeout=1.0)
+            self.batch_thread = None
     
     def _data_collection_worker(self):
         """Data collection worker thread."""
         while self.data_thread_active and self.analyzer:
             try:
+                t0 = time.perf_counter()
                 # Collect data from analyzer
                 self._collect_analyzer_data()
                 
-                # Emit data to connected clients
-                self.socketio.emit('data_update', self.latest_data)
+                # Emit data to connected clients (left to the batch worker when batching)
+                if not self.batch_interval:
+                    self._emit_data_update()
+                self._metrics['collect_ms'].append((time.perf_counter() - t0) * 1000)
                 
                 time.sleep(0.05)  # 20 Hz update rate (increased from 10 Hz for higher frequency metrics)
             except Exception as e:
@@ -315,10 +806,47 @@ class BehavioralWebUI:
                     print(f"Failed to emit fallback data: {emit_error}")
                 time.sleep(0.05)  # 20 Hz update rate (increased from 10 Hz)
     
+    def _emit_data_update(self):
+        """Emit the latest data: full to regular clients, changed sections to delta clients."""
+        data = self.latest_data
+        last = self._last_emitted_data
+        if last is None:
+            changed = {name: data.get(name) for name in _DATA_SECTIONS}
+        else:
+            changed = {name: data.get(name) for name in _DATA_SECTIONS
+                       if data.get(name) != last.get(name)}
+        if not changed:
+            return
+        self._last_emitted_data = data
+        
+        delta_clients = list(self._delta_clients)
+        if delta_clients:
+            changed['timestamp'] = data.get('timestamp')
+            self.socketio.emit('data_delta', changed, to=_DATA_DELTA_ROOM)
+            self.socketio.emit('data_update', data, skip_sid=delta_clients)
+        else:
+            self.socketio.emit('data_update', data)
+    
+    def _emit_batch_worker(self):
+        """Emit the latest data and newest encoded frame once per batch interval.
+        
+        Data follows the regular full/delta split and the frame only goes to video
+        subscribers that have acknowledged their previous one.
+        """
+        while self.data_thread_active and self.analyzer:
+            try:
+                time.sleep(self.batch_interval)
+                self._emit_data_update()
+                frame = self._pending_frame
+                self._pending_frame = None
+                if frame is not None:
+                    self._emit_frame(frame)
+            except Exception as e:
+                print(f"Batch emit error: {e}")
+                time.sleep(0.1)
+    
     def _convert_numpy_types(self, obj):
         """Convert numpy types to native Python types for JSON serialization."""
-        import numpy as np
-        
         if isinstance(obj, dict):
             return {key: self._convert_numpy_types(value) for key, value in obj.items()}
         elif isinstance(obj, list):
@@ -343,54 +871,62 @@ class BehavioralWebUI:
         
         # Video analysis data
         video_data = {}
-        if hasattr(self.analyzer, 'video_analyzer'):
-            va = self.analyzer.video_analyzer
+        va = getattr(self.analyzer, 'video_analyzer', None)
+        if va is not None:
+            (current_emotion, emotion_scores, attention_state, posture_state, movement_level,
+             fatigue_level, blink_count, last_reset_time, total_blink_count, performance_tracker,
+             main_person, current_detections, ear_values, blink_duration, blink_intervals,
+             left_ear_values, right_ear_values, drowsiness_frames,
+             object_detector) = _snapshot_attrs(va, _VIDEO_STATE_GETTER, _VIDEO_STATE_ATTRS)
             
             # Calculate current EAR and threshold for metrics
             current_ear = 0.0
             ear_threshold = 0.25
-            if hasattr(va, 'ear_values') and len(va.ear_values) > 0:
-                current_ear = sum(list(va.ear_values)[-10:]) / min(10, len(va.ear_values))
+            if ear_values:
+                current_ear = sum(list(ear_values)[-10:]) / min(10, len(ear_values))
                 ear_threshold = getattr(va, 'ear_threshold', 0.25)
             
             # Calculate blink metrics
             avg_blink_duration = 0.0
             avg_blink_interval = 0.0
-            if hasattr(va, 'blink_duration') and va.blink_duration:
-                avg_blink_duration = sum(va.blink_duration) / len(va.blink_duration)
-            if hasattr(va, 'blink_intervals') and va.blink_intervals:
-                avg_blink_interval = sum(va.blink_intervals) / len(va.blink_intervals)
+            if blink_duration:
+                avg_blink_duration = sum(blink_duration) / len(blink_duration)
+            if blink_intervals:
+                avg_blink_interval = sum(blink_intervals) / len(blink_intervals)
             
             # Calculate eye asymmetry
             eye_asymmetry = 0.0
-            if hasattr(va, 'left_ear_values') and hasattr(va, 'right_ear_values'):
-                if len(va.left_ear_values) > 5 and len(va.right_ear_values) > 5:
-                    left_avg = sum(va.left_ear_values) / len(va.left_ear_values)
-                    right_avg = sum(va.right_ear_values) / len(va.right_ear_values)
+            if left_ear_values is not None and right_ear_values is not None:
+                if len(left_ear_values) > 5 and len(right_ear_values) > 5:
+                    left_avg = sum(left_ear_values) / len(left_ear_values)
+                    right_avg = sum(right_ear_values) / len(right_ear_values)
                     eye_asymmetry = abs(left_avg - right_avg) / max((left_avg + right_avg) / 2, 0.001)
             
             # Calculate drowsiness score
             drowsiness_score = 0.0
-            if hasattr(va, 'drowsiness_frames') and hasattr(va, 'ear_values'):
-                drowsiness_score = va.drowsiness_frames / max(1, len(va.ear_values))
+            if drowsiness_frames is not None and ear_values is not None:
+                drowsiness_score = drowsiness_frames / max(1, len(ear_values))
             
             # Get object detections
-            object_detections = []
-            if hasattr(va, 'current_detections'):
-                object_detections = va.current_detections
+            object_detections = current_detections if current_detections is not None else []
+            
+            if last_reset_time is None:
+                last_reset_time = current_time
+            get_person_tracking = getattr(va, '_get_person_tracking_data', None)
+            person_tracking = get_person_tracking() if get_person_tracking else {}
             
             video_data = {
-                'emotion': str(getattr(va, 'current_emotion', 'Unknown')),
-                'emotion_scores': getattr(va, 'emotion_scores', {}),
-                'attention_state': str(getattr(va, 'attention_state', 'Unknown')),
-                'posture_state': str(getattr(va, 'posture_state', 'Unknown')),
-                'movement_level': str(getattr(va, 'movement_level', 'Unknown')),
-                'fatigue_level': str(getattr(va, 'fatigue_level', 'Normal')),
-                'blink_rate': float(getattr(va, 'blink_count', 0) / max(1, current_time - getattr(va, 'last_reset_time', current_time)) * 60.0),
-                'total_blinks': int(getattr(va, 'total_blink_count', 0)),
-                'fps': float(getattr(va.performance_tracker, 'current_fps', 0.0) if hasattr(va, 'performance_tracker') else 0.0),
-                'person_tracking': getattr(va, '_get_person_tracking_data', lambda: {})(),
-                'main_person': getattr(va, 'main_person', None),
+                'emotion': str(current_emotion),
+                'emotion_scores': emotion_scores if emotion_scores is not None else {},
+                'attention_state': str(attention_state),
+                'posture_state': str(posture_state),
+                'movement_level': str(movement_level),
+                'fatigue_level': str(fatigue_level),
+                'blink_rate': float(blink_count / max(1, current_time - last_reset_time) * 60.0),
+                'total_blinks': int(total_blink_count),
+                'fps': float(getattr(performance_tracker, 'current_fps', 0.0) if performance_tracker is not None else 0.0),
+                'person_tracking': person_tracking,
+                'main_person': main_person,
                 # Additional detailed metrics - now included
                 'ear': current_ear,
                 'ear_threshold': ear_threshold,
@@ -410,8 +946,7 @@ class BehavioralWebUI:
             # Handle confidence conversion - it can be a string like "low", "medium", "high"
             confidence_value = getattr(aa, 'current_confidence', 0.0)
             if isinstance(confidence_value, str):
-                confidence_map = {"low": 0.3, "medium": 0.6, "high": 0.9}
-                confidence_numeric = confidence_map.get(confidence_value.lower(), 0.0)
+                confidence_numeric = _CONFIDENCE_SCORES.get(confidence_value.lower(), 0.0)
             else:
                 confidence_numeric = float(confidence_value)
             
@@ -453,14 +988,12 @@ class BehavioralWebUI:
         
         # Object detection data
         objects_data = {}
-        if hasattr(self.analyzer, 'video_analyzer') and hasattr(self.analyzer.video_analyzer, 'object_detector'):
-            od = self.analyzer.video_analyzer.object_detector
-            if od:
-                objects_data = {
-                    'detections': getattr(self.analyzer.video_analyzer, 'current_detections', []),
-                    'summary': od.get_detection_summary(),
-                    'object_counts': getattr(od, 'object_counts', {})
-                }
+        if va is not None and object_detector:
+            objects_data = {
+                'detections': video_data['current_detections'],
+                'summary': object_detector.get_detection_summary(),
+                'object_counts': getattr(object_detector, 'object_counts', {})
+            }
         
         # Track emotion changes
         current_emotion = video_data.get('emotion', 'Unknown')
@@ -472,21 +1005,22 @@ class BehavioralWebUI:
         # Track attention scores
         attention_state = video_data.get('attention_state', 'Unknown')
         if attention_state != 'Unknown':
-            attention_score = self._attention_state_to_score(attention_state)
+            attention_score = _ATTENTION_SCORES.get(attention_state)
             if attention_score is not None:
+                # The deque drops its oldest score when full; keep the running sum in step
+                if len(self.attention_scores) == self.attention_scores.maxlen:
+                    self._attention_sum -= self.attention_scores[0]
                 self.attention_scores.append(attention_score)
-                # Keep only last 100 scores
-                if len(self.attention_scores) > 100:
-                    self.attention_scores.pop(0)
+                self._attention_sum += attention_score
         
         # Calculate average attention
         avg_attention = 0.0
         if self.attention_scores:
-            avg_attention = sum(self.attention_scores) / len(self.attention_scores)
+            avg_attention = self._attention_sum / len(self.attention_scores)
         
         # Calculate fatigue score
         fatigue_level = video_data.get('fatigue_level', 'Normal')
-        fatigue_score = self._fatigue_level_to_score(fatigue_level)
+        fatigue_score = _FATIGUE_SCORES.get(fatigue_level, 20.0)
         
         # Session statistics
         session_stats = {
@@ -498,20 +1032,32 @@ class BehavioralWebUI:
             'timestamp': float(current_time)
         }
         
-        # Convert all numpy types to native Python types
-        video_data = self._convert_numpy_types(video_data)
-        audio_data = self._convert_numpy_types(audio_data)
-        objects_data = self._convert_numpy_types(objects_data)
-        session_stats = self._convert_numpy_types(session_stats)
-        
-        # Update latest data
-        self.latest_data = {
+        latest_data = {
             'video': video_data,
             'audio': audio_data,
             'objects': objects_data,
             'session_stats': session_stats,
             'timestamp': float(current_time)
         }
+        
+        if ORJSON_AVAILABLE:
+            # Serialize each section once; the bytes no longer share mutable dicts with the
+            # analyzer threads, and Socket.IO packets and /api/data embed them as Fragments
+            # without encoding them again. An unchanged section keeps its previous Fragment
+            # object, which is how _emit_data_update tells it apart from a changed one.
+            previous = self._section_fragments
+            sections = {}
+            for name in _DATA_SECTIONS:
+                raw = _orjson_dumps(latest_data[name])
+                kept = previous.get(name)
+                sections[name] = kept if kept is not None and kept[0] == raw else (raw, orjson.Fragment(raw))
+            self._section_fragments = sections
+            snapshot = {name: fragment for name, (_, fragment) in sections.items()}
+            snapshot['timestamp'] = latest_data['timestamp']
+            self.latest_data = snapshot
+        else:
+            # Convert all numpy types to native Python types
+            self.latest_data = self._convert_numpy_types(latest_data)
     
     def start_analyzer(self):
         """Start the behavioral analyzer."""
@@ -560,36 +1106,37 @@ class BehavioralWebUI:
     
     def _frame_processing_worker(self):
         """Continuously process frames from the camera (optimized)."""
-        last_frame_time = time.time()
         target_fps = 30.0
-        frame_time = 1.0 / target_fps
+        
+        # Analyze every n-th camera frame; the ones in between are only grabbed, which
+        # keeps the capture buffer fresh without paying for their decode
+        camera_fps = 0.0
+        if hasattr(self.analyzer, 'cap'):
+            camera_fps = self.analyzer.cap.get(cv2.CAP_PROP_FPS) or 0.0
+        skip_interval = max(0, round(camera_fps / target_fps) - 1)
+        skipped = 0
         
         while self.frame_processing_active and self.analyzer:
             try:
                 if self.analyzer and self.analyzer.is_running:
-                    current_time = time.time()
-                    elapsed = current_time - last_frame_time
+                    if skipped < skip_interval:
+                        if not self.analyzer.process_frame_light():
+                            time.sleep(0.01)
+                        skipped += 1
+                        continue
+                    skipped = 0
                     
-                    # Process frame only if enough time has passed (maintain target FPS)
-                    if elapsed >= frame_time:
-                        success, frame = self.analyzer.process_frame()
-                        if success and frame is not None:
-                            # Store the processed frame for video streaming (avoid copy if possible)
-                            if hasattr(self.analyzer, 'video_analyzer'):
-                                # Only copy if frame will be modified elsewhere
-                                if hasattr(self.analyzer.video_analyzer, 'current_frame') and \
-                                   self.analyzer.video_analyzer.current_frame is not None:
-                                    # Reuse existing frame buffer if same size
-                                    if frame.shape == self.analyzer.video_analyzer.current_frame.shape:
-                                        np.copyto(self.analyzer.video_analyzer.current_frame, frame)
-                                    else:
-                                        self.analyzer.video_analyzer.current_frame = frame.copy()
-                                else:
-                                    self.analyzer.video_analyzer.current_frame = frame.copy()
-                        last_frame_time = current_time
+                    t0 = time.perf_counter()
+                    success, frame = self.analyzer.process_frame()
+                    self._metrics['process_ms'].append((time.perf_counter() - t0) * 1000)
+                    if success and frame is not None:
+                        # process_frame() returns a freshly allocated array that is never written
+                        # again, so readers can share it by reference (the assignment is atomic)
+                        if hasattr(self.analyzer, 'video_analyzer'):
+                            self.analyzer.video_analyzer.current_frame = frame
+                        self._publish_frame(frame)
                     else:
-                        # Sleep for remaining time to maintain FPS
-                        time.sleep(max(0, frame_time - elapsed))
+                        time.sleep(0.01)
                 else:
                     time.sleep(0.1)
             except Exception as e:
@@ -598,6 +1145,41 @@ class BehavioralWebUI:
                 traceback.print_exc()
                 time.sleep(0.1)
     
+    def _nodelay_server_options(self) -> Dict[str, Any]:
+        """
+        Server options that disable Nagle's algorithm on accepted connections.
+        
+        data_update messages are small and latency-sensitive, so they should not wait
+        for more data to coalesce with.
+        
+        Returns:
+            Keyword arguments for socketio.run() matching the active async mode
+        """
+        async_mode = self.socketio.server.eio.async_mode
+        
+        if async_mode == 'eventlet':
+            from eventlet import wsgi
+            
+            class _NoDelayHttpProtocol(wsgi.HttpProtocol):
+                def setup(self):
+                    try:
+                        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                    except OSError:
+                        pass
+                    super().setup()
+            
+            return {'protocol': _NoDelayHttpProtocol}
+        
+        if async_mode == 'threading':
+            from werkzeug.serving import WSGIRequestHandler
+            
+            class _NoDelayRequestHandler(WSGIRequestHandler):
+                disable_nagle_algorithm = True
+            
+            return {'request_handler': _NoDelayRequestHandler}
+        
+        return {}
+    
     def run(self, host='0.0.0.0', port=5000, debug=False):
         """
         Run the web UI server.
@@ -611,7 +1193,8 @@ class BehavioralWebUI:
         print("Press Ctrl+C to stop")
         
         try:
-            self.socketio.run(self.app, host=host, port=port, debug=debug)
+            self.socketio.run(self.app, host=host, port=port, debug=debug,
+                              **self._nodelay_server_options())
         except KeyboardInterrupt:
             print("\nShutting down web UI...")
             self.stop_analyzer()
@@ -16,6 +16,8 @@ class BehavioralDashboard {
         };
         this.sessionStartTime = Date.now();
         this.lastUpdateTime = Date.now();
+        this.frameObjectUrl = null;
+        this.latestData = null;
         
         this.init();
     }
@@ -35,6 +37,15 @@ class BehavioralDashboard {
             console.log('Connected to server');
             this.updateConnectionStatus(true);
             this.showNotification('Connected to server', 'success');
+            
+            // Receive only the sections that changed since the last update
+            this.socket.emit('subscribe_data_delta');
+            
+            // Frames are only sent to subscribed clients
+            const videoToggle = document.getElementById('video-stream');
+            if (!videoToggle || videoToggle.checked) {
+                this.setVideoSubscription(true);
+            }
         });
         
         this.socket.on('disconnect', () => {
@@ -50,11 +61,22 @@ class BehavioralDashboard {
         });
         
         this.socket.on('data_update', (data) => {
+            this.latestData = data;
             this.updateDashboard(data);
         });
         
-        this.socket.on('video_frame', (data) => {
-            this.updateVideoFeed(data.frame);
+        this.socket.on('data_delta', (delta) => {
+            this.latestData = { ...(this.latestData || {}), ...delta };
+            this.updateDashboard(this.latestData);
+        });
+        
+        // Frame events carry an ack callback; acking after display lets the server pace this client
+        this.socket.on('video_frame', (data, ack) => {
+            this.updateVideoFeed(data.frame ? `data:image/jpeg;base64,${data.frame}` : null, ack);
+        });
+        
+        this.socket.on('video_frame_bin', (data, ack) => {
+            this.updateVideoFeedBinary(data, ack);
         });
         
         this.socket.on('status', (data) => {
@@ -210,12 +232,19 @@ class BehavioralDashboard {
         if (videoToggle) {
             videoToggle.checked = true; // Auto-enable
             videoToggle.addEventListener('change', (e) => {
-                this.socket.emit('toggle_video_stream', { enabled: e.target.checked });
+                this.setVideoSubscription(e.target.checked);
                 this.showNotification(`Video stream ${e.target.checked ? 'enabled' : 'disabled'}`, e.target.checked ? 'success' : 'warning');
             });
         }
     }
     
+    setVideoSubscription(enabled) {
+        // Ask for frames no wider than the feed is actually displayed
+        const videoContainer = document.getElementById('video-container');
+        const streamWidth = videoContainer ? Math.round(videoContainer.clientWidth * (window.devicePixelRatio || 1)) : null;
+        this.socket.emit('toggle_video_stream', { enabled: enabled, stream_width: streamWidth });
+    }
+    
     startSessionTimer() {
         setInterval(() => {
             const elapsed = Date.now() - this.sessionStartTime;
@@ -509,20 +538,39 @@ class BehavioralDashboard {
         }
     }
     
-    updateVideoFeed(frameData) {
+    updateVideoFeedBinary(frameBytes, ack) {
+        if (!frameBytes) {
+            this.updateVideoFeed(null, ack);
+            return;
+        }
+        
+        // The previous frame's blob is released once the new one has loaded (see updateVideoFeed)
+        this.frameObjectUrl = URL.createObjectURL(new Blob([frameBytes], { type: 'image/jpeg' }));
+        this.updateVideoFeed(this.frameObjectUrl, ack);
+    }
+    
+    updateVideoFeed(frameSrc, ack) {
         const videoElement = document.getElementById('video-feed');
         const placeholderElement = document.getElementById('video-placeholder');
         const videoContainer = document.getElementById('video-container');
         const videoStatus = document.getElementById('video-status');
         
-        if (frameData) {
+        if (frameSrc) {
             // Add fade effect
             videoElement.classList.add('loading');
             
             // Use requestAnimationFrame for smooth updates
             requestAnimationFrame(() => {
-                videoElement.src = `data:image/jpeg;base64,${frameData}`;
+                // Whatever blob the image showed until now can go once this frame settles
+                const previousSrc = videoElement.src;
+                const settle = () => {
+                    if (previousSrc && previousSrc !== frameSrc && previousSrc.startsWith('blob:')) {
+                        URL.revokeObjectURL(previousSrc);
+                    }
+                    if (ack) ack();
+                };
                 videoElement.onload = () => {
+                    settle();
                     videoElement.classList.remove('loading');
                     videoElement.style.display = 'block';
                     placeholderElement.style.display = 'none';
@@ -530,17 +578,20 @@ class BehavioralDashboard {
                     if (videoStatus) videoStatus.style.display = 'block';
                 };
                 videoElement.onerror = () => {
+                    settle();
                     console.error('Failed to load video frame');
                     videoElement.style.display = 'none';
                     placeholderElement.style.display = 'flex';
                     if (videoStatus) videoStatus.style.display = 'none';
                 };
+                videoElement.src = frameSrc;
             });
         } else {
             videoElement.style.display = 'none';
             placeholderElement.style.display = 'flex';
             videoContainer.style.background = 'linear-gradient(135deg, #667eea 0%, #764ba2 100%)';
             if (videoStatus) videoStatus.style.display = 'none';
+            if (ack) ack();
         }
     }
     
@@ -3,13 +3,23 @@ FUSION API Server
 RESTful API for accessing behavioral metrics
 """
 
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from typing import Optional, Dict, Any
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from typing import Optional, Dict, Any, Tuple
+from collections import Counter, OrderedDict, deque
 import logging
-from datetime import datetime
+import hashlib
+import heapq
+import itertools
+import time
+import traceback
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import os
 import sqlite3
-import json
+import orjson
 
 from db.models import MetricsDatabase
 from integration.metrics_processor import MetricsProcessor
@@ -17,7 +27,8 @@ from integration.metrics_processor import MetricsProcessor
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="FUSION API", version="1.0.0")
+# orjson serializes the large metric/report payloads several times faster than stdlib json
+app = FastAPI(title="FUSION API", version="1.0.0", default_response_class=ORJSONResponse)
 
 # CORS middleware for CONVEI frontend
 app.add_middleware(
@@ -28,11 +39,112 @@ app.add_middleware(
     allow_headers=["*"],
     expose_headers=["*"],
 )
+# Report and range payloads are repetitive JSON; small responses aren't worth compressing.
+# GZipMiddleware also sets Vary: Accept-Encoding.
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=5)
 
 # Initialize database and processor
 db = MetricsDatabase()
 processor = MetricsProcessor(db)
 
+# "current" requests all resolve the newest session; pollers hit this several times a second
+_LATEST_SESSION_TTL = 1.5  # seconds
+# Newest session in one round-trip: unified_metrics wins whenever it has rows, then
+# video_metrics, then audio_metrics. Each branch is an index seek, and the fixed string lets
+# every connection's statement cache reuse the compiled plan.
+_LATEST_SESSION_SQL = """
+    SELECT session_id, src FROM (
+        SELECT * FROM (SELECT session_id, 1 AS pri, 'unified_metrics' AS src
+                       FROM unified_metrics ORDER BY timestamp DESC LIMIT 1)
+        UNION ALL
+        SELECT * FROM (SELECT session_id, 2 AS pri, 'video_metrics' AS src
+                       FROM video_metrics ORDER BY timestamp DESC LIMIT 1)
+        UNION ALL
+        SELECT * FROM (SELECT session_id, 3 AS pri, 'audio_metrics' AS src
+                       FROM audio_metrics ORDER BY timestamp DESC LIMIT 1)
+    )
+    ORDER BY pri ASC
+    LIMIT 1
+"""
+# The current-metrics and context endpoints only read unified_metrics, so they only
+# resolve sessions that have unified rows
+_LATEST_UNIFIED_SESSION_SQL = """
+    SELECT session_id, 'unified_metrics' FROM unified_metrics ORDER BY timestamp DESC LIMIT 1
+"""
+_latest_session_cache = {
+    sql: {"val": (None, None), "exp": 0.0} for sql in (_LATEST_SESSION_SQL, _LATEST_UNIFIED_SESSION_SQL)
+}
+_latest_session_lock = asyncio.Lock()
+
+
+async def resolve_latest_session(unified_only: bool = False) -> Tuple[Optional[str], Optional[str]]:
+    """Return (session_id, table) of the latest session, cached for a short TTL
+    
+    With unified_only, video- and audio-only sessions are not considered.
+    """
+    sql = _LATEST_UNIFIED_SESSION_SQL if unified_only else _LATEST_SESSION_SQL
+    cache = _latest_session_cache[sql]
+    if time.monotonic() < cache["exp"]:
+        return cache["val"]
+    
+    # Requests arriving while the cache is stale wait for one refresh instead of each querying
+    async with _latest_session_lock:
+        if time.monotonic() < cache["exp"]:
+            return cache["val"]
+        rows = await db.fetchall_async(sql)
+        latest = (rows[0][0], rows[0][1]) if rows else (None, None)
+        cache["val"] = latest
+        cache["exp"] = time.monotonic() + _LATEST_SESSION_TTL
+        return latest
+
+
+def _etag_headers(session_id: str, version) -> Dict[str, str]:
+    """Caching headers for a response that changes only when the session's version does
+    
+    version is the newest metric's timestamp, or for reports its rowid.
+    """
+    # Hashed so arbitrary session ids stay a short, header-safe token
+    digest = hashlib.blake2b(f"{session_id}:{version}".encode(), digest_size=8).hexdigest()
+    return {"ETag": f'W/"{digest}"', "Cache-Control": "private, max-age=1"}
+
+
+def _is_not_modified(request: Request, headers: Optional[Dict[str, str]]) -> bool:
+    """True if the client's If-None-Match already names this response's ETag"""
+    if not headers:
+        return False
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison, so a W/ prefix on either side is ignored
+    etag = headers["ETag"].removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+# (newest metric rowid, _ReportState, serialized report, monotonic time last validated)
+# keyed by session_id; a report is reused until the collector writes another metric, then
+# extended with just the new rows. Within _REPORT_FRESH_TTL of the last validation it is
+# served without querying at all, matching the max-age=1 clients are already told to cache for.
+_REPORT_CACHE_SIZE = 32
+_REPORT_FRESH_TTL = 1.0
+_report_cache: "OrderedDict[str, tuple]" = OrderedDict()
+
+
+def _mark_report_validated(session_id: str, entry: tuple):
+    """Restart a cached report's freshness window, unless another request replaced or evicted it"""
+    if _report_cache.get(session_id) is entry:
+        _report_cache[session_id] = (*entry[:3], time.monotonic())
+        _report_cache.move_to_end(session_id)
+
+
+# uvicorn worker processes (opt-in; each has its own connections, caches and report pool)
+_API_WORKERS = max(1, int(os.environ.get("FUSION_API_WORKERS", "1")))
+
+# Split the CPUs between workers so several processes don't each claim all of them
+_report_pool = ThreadPoolExecutor(max_workers=max(1, (os.cpu_count() or 4) // _API_WORKERS),
+                                  thread_name_prefix="report")
+
 
 @app.get("/")
 async def root():
@@ -41,29 +153,23 @@ async def root():
 
 
 @app.get("/api/metrics/current/{session_id}")
-async def get_current_metrics(session_id: str):
+async def get_current_metrics(request: Request, session_id: str):
     """Get current metrics for a session"""
     try:
         # If session_id is "current", find the latest session with metrics
         if session_id == "current":
-            cursor = db.conn.cursor()
-            cursor.execute("""
-                SELECT session_id, MAX(timestamp) as last_time
-                FROM unified_metrics
-                GROUP BY session_id
-                ORDER BY last_time DESC
-                LIMIT 1
-            """)
-            result = cursor.fetchone()
-            if result:
-                session_id = result[0]
-            else:
+            session_id, _ = await resolve_latest_session(unified_only=True)
+            if not session_id:
                 raise HTTPException(status_code=404, detail="No metrics found")
         
-        metrics = db.get_current_metrics(session_id)
+        metrics = await asyncio.to_thread(db.get_current_metrics, session_id)
         if not metrics:
             raise HTTPException(status_code=404, detail="No metrics found for session")
-        return metrics
+        
+        headers = _etag_headers(session_id, metrics.get('timestamp'))
+        if _is_not_modified(request, headers):
+            return Response(status_code=304, headers=headers)
+        return ORJSONResponse(metrics, headers=headers)
     except HTTPException:
         # Re-raise HTTP exceptions (like 404)
         raise
@@ -80,18 +186,129 @@ async def get_metrics_range(
 ):
     """Get metrics for a time range"""
     try:
+        now = time.time()
         if not start:
-            start = datetime.now().timestamp() - 60  # Default: last minute
+            start = now - 60  # Default: last minute
         if not end:
-            end = datetime.now().timestamp()
+            end = now
         
-        metrics = db.get_metrics_range(session_id, start, end)
-        return {"metrics": metrics, "count": len(metrics)}
+        rows = await asyncio.to_thread(db.iter_metrics_range, session_id, start, end, _STREAM_BATCH_ROWS)
+        # Stream the rows as they are fetched instead of building the whole list and its JSON
+        return StreamingResponse(_stream_metrics_json(rows), media_type="application/json")
     except Exception as e:
         logger.error(f"Error getting metrics range: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Reports are versioned by rowid, which grows with every insert even when a row's timestamp
+# does not; idx_unified_metrics_sid serves this and the since-rowid scan below
+_REPORT_VERSION_SQL = "SELECT MAX(rowid) FROM unified_metrics WHERE session_id = ?"
+# The full scan reads only columns in idx_unified_metrics_report_cov (plus the rowid every
+# index entry carries), so SQLite never touches the table or the JSON blobs; the since-rowid
+# scan seeks straight to the few new rows and reads just those from the table
+# Equal timestamps fold in insertion order, so rows appended later always sort after the
+# rows a cached report already holds
+_REPORT_METRICS_SQL = """
+    SELECT rowid AS row_id, session_id, timestamp, unified_emotion, unified_sentiment,
+           attention_score, unified_fatigue, engagement_level
+    FROM unified_metrics
+    WHERE session_id = ?
+    ORDER BY timestamp ASC, rowid ASC
+"""
+_REPORT_METRICS_SINCE_SQL = """
+    SELECT rowid AS row_id, session_id, timestamp, unified_emotion, unified_sentiment,
+           attention_score, unified_fatigue, engagement_level
+    FROM unified_metrics
+    WHERE session_id = ? AND rowid > ?
+    ORDER BY rowid ASC
+"""
+# Full rows, JSON columns included, for the few rows echoed in raw_metrics_sample
+_REPORT_SAMPLE_SQL = """
+    SELECT rowid AS row_id, *
+    FROM unified_metrics
+    WHERE rowid IN ({placeholders})
+"""
+
+# Per-table scans for synthesizing unified rows, served by the (session_id, timestamp) indexes
+_SYNTH_VIDEO_SQL = """
+    SELECT * FROM video_metrics
+    WHERE session_id = ?
+    ORDER BY timestamp ASC
+"""
+_SYNTH_AUDIO_SQL = """
+    SELECT * FROM audio_metrics
+    WHERE session_id = ?
+    ORDER BY timestamp ASC
+"""
+
+
+def _synthesize_metrics(session_id: str, video_rows: list, audio_rows: list) -> list:
+    """Unified metrics built from video/audio rows when a session has no unified rows
+    
+    One row per distinct timestamp, paired with the first video and audio row within a
+    second of it. Both inputs are ordered by timestamp, so a single merge pass with a
+    forward-only cursor per table does the pairing.
+    """
+    video_metrics = [dict(row) for row in video_rows]
+    audio_metrics = [dict(row) for row in audio_rows]
+    metrics = []
+    vi = ai = 0
+    for ts, _ in itertools.groupby(heapq.merge((m['timestamp'] for m in video_metrics),
+                                                 (m['timestamp'] for m in audio_metrics))):
+        # Skip rows a second or more behind ts; they are behind every later ts too
+        while vi < len(video_metrics) and video_metrics[vi]['timestamp'] - ts <= -1:
+            vi += 1
+        while ai < len(audio_metrics) and audio_metrics[ai]['timestamp'] - ts <= -1:
+            ai += 1
+        video_m = video_metrics[vi] if vi < len(video_metrics) and abs(video_metrics[vi]['timestamp'] - ts) < 1 else None
+        audio_m = audio_metrics[ai] if ai < len(audio_metrics) and abs(audio_metrics[ai]['timestamp'] - ts) < 1 else None
+        metrics.append({
+            'session_id': session_id,
+            'timestamp': ts,
+            'unified_emotion': video_m.get('emotion') if video_m else audio_m.get('emotion') if audio_m else 'neutral',
+            'unified_attention': video_m.get('attention_state') if video_m else None,
+            'unified_posture': video_m.get('posture_state') if video_m else None,
+            'unified_movement': video_m.get('movement_level') if video_m else None,
+            'unified_fatigue': video_m.get('fatigue_level') if video_m else None,
+            'unified_sentiment': audio_m.get('sentiment') if audio_m else None,
+            'attention_score': video_m.get('attention_score') if video_m else None,
+            'engagement_level': 'medium',
+            'video_data': video_m,
+            'audio_data': audio_m
+        })
+    return metrics
+
+
+# unified_metrics columns stored as JSON text
+_JSON_COLUMNS = ('video_data', 'audio_data', 'stress_indicators')
+
+
+def _maybe_load(value):
+    """Parse a JSON text column with orjson, leaving already-parsed or invalid values as-is"""
+    if isinstance(value, (str, bytes)):
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            return value
+    return value
+
+
+# Rows per streamed chunk; StreamingResponse hops to a worker thread for every item it pulls
+# from a sync iterator, so per-row chunks would cost a thread round trip per row
+_STREAM_BATCH_ROWS = 500
+
+
+def _stream_metrics_json(rows):
+    """Yield {"metrics": [...], "count": n} incrementally, one batch of encoded rows at a time"""
+    yield b'{"metrics":['
+    count = 0
+    for batch in itertools.batched(rows, _STREAM_BATCH_ROWS):
+        chunk = b','.join(orjson.dumps(row, option=orjson.OPT_NON_STR_KEYS) for row in batch)
+        yield b',' + chunk if count else chunk
+        count += len(batch)
+    yield b'],"count":' + str(count).encode() + b'}'
+
+
 @app.get("/api/metrics/context/{session_id}")
 async def get_context_for_convei_get(
     session_id: str,
@@ -102,17 +319,9 @@ async def get_context_for_convei_get(
     try:
         # If session_id is "current" or empty, use the latest session with metrics
         if session_id == "current" or not session_id:
-            cursor = db.conn.cursor()
-            cursor.execute("""
-                SELECT session_id, MAX(timestamp) as last_time
-                FROM unified_metrics
-                GROUP BY session_id
-                ORDER BY last_time DESC
-                LIMIT 1
-            """)
-            result = cursor.fetchone()
-            if result:
-                session_id = result[0]
+            latest, _ = await resolve_latest_session(unified_only=True)
+            if latest:
+                session_id = latest
                 logger.debug(f"Using latest session with metrics: {session_id}")
             else:
                 session_id = "current_session"
@@ -121,12 +330,12 @@ async def get_context_for_convei_get(
         conv_context = None
         if conversation_context:
             try:
-                conv_context = json.loads(conversation_context)
+                conv_context = orjson.loads(conversation_context)
             except:
                 pass
         
-        context = processor.get_context_for_convei(session_id, window, conv_context)
-        return context
+        context = await asyncio.to_thread(processor.get_context_for_convei, session_id, window, conv_context)
+        return ORJSONResponse(context)
     except Exception as e:
         logger.error(f"Error getting context: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -142,17 +351,9 @@ async def get_context_for_convei_post(
     try:
         # If session_id is "current" or empty, use the latest session with metrics
         if session_id == "current" or not session_id:
-            cursor = db.conn.cursor()
-            cursor.execute("""
-                SELECT session_id, MAX(timestamp) as last_time
-                FROM unified_metrics
-                GROUP BY session_id
-                ORDER BY last_time DESC
-                LIMIT 1
-            """)
-            result = cursor.fetchone()
-            if result:
-                session_id = result[0]
+            latest, _ = await resolve_latest_session(unified_only=True)
+            if latest:
+                session_id = latest
                 logger.debug(f"Using latest session with metrics: {session_id}")
             else:
                 session_id = "current_session"
@@ -161,18 +362,32 @@ async def get_context_for_convei_post(
         conversation_context = None
         if request:
             try:
-                body = await request.json()
+                body = orjson.loads(await request.body())
                 conversation_context = body.get('conversation_context')
             except:
                 pass
         
-        context = processor.get_context_for_convei(session_id, window, conversation_context)
-        return context
+        context = await asyncio.to_thread(processor.get_context_for_convei, session_id, window, conversation_context)
+        return ORJSONResponse(context)
     except Exception as e:
         logger.error(f"Error getting context: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+_AGGREGATE_WINDOW_SQL = """
+    SELECT COUNT(*), AVG(unified_sentiment), AVG(attention_score),
+           (SELECT unified_emotion
+            FROM unified_metrics
+            WHERE session_id = ? AND timestamp >= ? AND timestamp <= ?
+              AND unified_emotion IS NOT NULL AND unified_emotion != ''
+            GROUP BY unified_emotion
+            ORDER BY COUNT(*) DESC
+            LIMIT 1)
+    FROM unified_metrics
+    WHERE session_id = ? AND timestamp >= ? AND timestamp <= ?
+"""
+
+
 @app.get("/api/metrics/aggregated/{session_id}")
 async def get_aggregated_metrics(
     session_id: str,
@@ -180,27 +395,27 @@ async def get_aggregated_metrics(
 ):
     """Get aggregated metrics for a time window"""
     try:
-        end_time = datetime.now().timestamp()
+        end_time = time.time()
         start_time = end_time - window
         
-        metrics = db.get_metrics_range(session_id, start_time, end_time)
-        
-        if not metrics:
-            return {"message": "No metrics in time window"}
+        # Let SQLite compute the aggregates and the dominant emotion in a single statement
+        window_params = (session_id, start_time, end_time)
+        totals = await db.fetchall_async(_AGGREGATE_WINDOW_SQL, window_params * 2)
+        metric_count, avg_sentiment, avg_attention, dominant_emotion = totals[0]
         
-        # Aggregate
-        emotions = [m.get("unified_emotion") for m in metrics if m.get("unified_emotion")]
-        sentiments = [m.get("unified_sentiment") for m in metrics if m.get("unified_sentiment") is not None]
-        attention_scores = [m.get("attention_score") for m in metrics if m.get("attention_score") is not None]
+        if not metric_count:
+            return ORJSONResponse({"message": "No metrics in time window"})
         
-        from collections import Counter
-        dominant_emotion = Counter(emotions).most_common(1)[0][0] if emotions else "neutral"
-        avg_sentiment = sum(sentiments) / len(sentiments) if sentiments else 0.0
-        avg_attention = sum(attention_scores) / len(attention_scores) if attention_scores else 50.0
+        if not dominant_emotion:
+            dominant_emotion = "neutral"
+        if avg_sentiment is None:
+            avg_sentiment = 0.0
+        if avg_attention is None:
+            avg_attention = 50.0
         
-        return {
+        return ORJSONResponse({
             "window_seconds": window,
-            "metric_count": len(metrics),
+            "metric_count": metric_count,
             "dominant_emotion": dominant_emotion,
             "average_sentiment": avg_sentiment,
             "average_attention": avg_attention,
@@ -208,117 +423,339 @@ async def get_aggregated_metrics(
                 "start": start_time,
                 "end": end_time
             }
-        }
+        })
     except Exception as e:
         logger.error(f"Error getting aggregated metrics: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _classify_stability(transitions: int, total: int) -> str:
+    """Label emotional stability from the transition rate"""
+    if transitions < total * 0.2:
+        return "stable"
+    if transitions < total * 0.4:
+        return "moderate"
+    return "volatile"
+
+
+def _classify_sentiment(average: float) -> str:
+    """Label the overall sentiment from its average"""
+    if average > 0.2:
+        return "positive"
+    if average < -0.2:
+        return "negative"
+    return "neutral"
+
+
+def _classify_attention(average: float) -> str:
+    """Label attention quality from the average attention score"""
+    if average > 80:
+        return "excellent"
+    if average > 60:
+        return "good"
+    if average > 40:
+        return "moderate"
+    return "needs_improvement"
+
+
+class _RunningStats:
+    """Running count/sum/min/max of a numeric column"""
+    __slots__ = ('count', 'total', 'min', 'max')
+    
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+    
+    def add(self, value):
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+    
+    def summary(self, default: tuple) -> tuple:
+        """(mean, min, max), or default when nothing was added"""
+        if not self.count:
+            return default
+        return self.total / self.count, self.min, self.max
+    
+    def copy(self) -> "_RunningStats":
+        other = _RunningStats()
+        other.count, other.total, other.min, other.max = self.count, self.total, self.min, self.max
+        return other
+
+
+class _ReportState:
+    """Rolling per-session report aggregates
+    
+    Holds only counters, running stats and the few rows the report echoes back, so a cached
+    state can be extended with just the metrics written since instead of rescanning the session.
+    """
+    
+    def __init__(self):
+        self.total = 0
+        self.first_timestamp = self.last_timestamp = None
+        self.emotion_counts = Counter()
+        self.emotion_total = 0
+        self.first_emotion = self.last_emotion = None
+        self.transitions_count = 0
+        self.emotion_transitions = []  # First 10 only
+        self.fatigue_counts = Counter()
+        self.engagement_counts = Counter()
+        self.sentiment = _RunningStats()
+        self.attention = _RunningStats()
+        self.head = []  # First 5 rows
+        self.tail = deque(maxlen=5)  # Last 5 rows
+        self.full_rows = {}  # row_id -> full table row, for the rows currently in the sample
+    
+    def copy(self) -> "_ReportState":
+        """Independent copy, so a cached state is never mutated while another request reads it"""
+        other = _ReportState()
+        other.__dict__.update(self.__dict__)
+        other.emotion_counts = self.emotion_counts.copy()
+        other.emotion_transitions = list(self.emotion_transitions)
+        other.fatigue_counts = self.fatigue_counts.copy()
+        other.engagement_counts = self.engagement_counts.copy()
+        other.sentiment = self.sentiment.copy()
+        other.attention = self.attention.copy()
+        other.head = list(self.head)
+        other.tail = deque(self.tail, maxlen=5)
+        other.full_rows = dict(self.full_rows)
+        return other
+    
+    def add(self, metrics: list):
+        """Fold metric rows (sqlite3.Row or dict, oldest first) into the aggregates"""
+        if not metrics:
+            return
+        if self.total < 5:
+            self.head.extend(metrics[:5 - self.total])
+        self.tail.extend(metrics[-5:])
+        if self.first_timestamp is None:
+            self.first_timestamp = metrics[0]['timestamp']
+        self.last_timestamp = metrics[-1]['timestamp']
+        self.total += len(metrics)
+        
+        emotion_counts = self.emotion_counts
+        fatigue_counts = self.fatigue_counts
+        engagement_counts = self.engagement_counts
+        prev_emotion = self.last_emotion
+        for m in metrics:
+            emotion = m["unified_emotion"]
+            if emotion:
+                if prev_emotion is None:
+                    self.first_emotion = emotion
+                elif emotion != prev_emotion:
+                    self.transitions_count += 1
+                    if self.transitions_count <= 10:
+                        self.emotion_transitions.append({'from': prev_emotion, 'to': emotion, 'index': self.emotion_total})
+                prev_emotion = emotion
+                self.emotion_total += 1
+                emotion_counts[emotion] += 1
+            sentiment = m["unified_sentiment"]
+            if sentiment is not None:
+                self.sentiment.add(sentiment)
+            attention = m["attention_score"]
+            if attention is not None:
+                self.attention.add(attention)
+            fatigue = m["unified_fatigue"]
+            if fatigue:
+                fatigue_counts[fatigue] += 1
+            engagement = m["engagement_level"]
+            if engagement:
+                engagement_counts[engagement] += 1
+        self.last_emotion = prev_emotion
+    
+    def sample(self) -> list:
+        """The first and last 5 rows (every row when there are 10 or fewer)"""
+        if self.total > 10:
+            return self.head + list(self.tail)
+        if self.total > 5:
+            return self.head + list(self.tail)[5 - self.total:]
+        return list(self.head)
+    
+    def report(self, session_id: str, sample: Optional[list] = None) -> Dict[str, Any]:
+        """Render the aggregates into the report structure
+        
+        sample replaces the stored sample rows, e.g. with their full versions from the table.
+        """
+        # Only the sampled rows are returned with their JSON columns, so only those get parsed
+        raw_metrics_sample = [dict(metric) for metric in (self.sample() if sample is None else sample)]
+        for metric in raw_metrics_sample:
+            metric.pop('row_id', None)
+            for key in _JSON_COLUMNS:
+                if metric.get(key):
+                    metric[key] = _maybe_load(metric[key])
+        
+        emotion_counts = self.emotion_counts
+        # Sorted once; its first key doubles as the dominant emotion (ties keep first-seen order)
+        emotion_distribution = dict(emotion_counts.most_common())
+        emotion_total = self.emotion_total
+        transitions_count = self.transitions_count
+        avg_sentiment, sentiment_min, sentiment_max = self.sentiment.summary((0.0, 0.0, 0.0))
+        avg_attention, attention_min, attention_max = self.attention.summary((50.0, 0.0, 100.0))
+        has_attention = self.attention.count > 0
+        
+        # Session duration
+        if self.total >= 2:
+            duration_seconds = (self.last_timestamp or 0) - (self.first_timestamp or 0)
+        else:
+            duration_seconds = 0
+        
+        return {
+            "session_id": session_id,
+            "total_data_points": self.total,
+            "duration_seconds": duration_seconds,
+            "duration_formatted": "{}m {}s".format(*divmod(max(int(duration_seconds), 0), 60)),
+            "emotion_analysis": {
+                "distribution": emotion_distribution,
+                "dominant_emotion": next(iter(emotion_distribution), "neutral"),
+                "emotional_variety": len(emotion_counts),
+                "transitions_count": transitions_count,
+                "emotional_stability": _classify_stability(transitions_count, emotion_total)
+            },
+            "sentiment_analysis": {
+                "average": avg_sentiment,
+                "min": sentiment_min,
+                "max": sentiment_max,
+                "overall": _classify_sentiment(avg_sentiment)
+            },
+            "attention_analysis": {
+                "average_score": avg_attention,
+                "min_score": attention_min,
+                "max_score": attention_max,
+                "attention_quality": _classify_attention(avg_attention) if has_attention else "needs_improvement"
+            },
+            "fatigue_analysis": {
+                "distribution": dict(self.fatigue_counts),
+                "primary_state": self.fatigue_counts.most_common(1)[0][0] if self.fatigue_counts else "Normal"
+            },
+            "engagement_analysis": {
+                "distribution": dict(self.engagement_counts),
+                "primary_level": self.engagement_counts.most_common(1)[0][0] if self.engagement_counts else "medium"
+            },
+            "timeline": {
+                "emotion_transitions": list(self.emotion_transitions),  # First 10 transitions
+                "first_emotion": self.first_emotion or "neutral",
+                "last_emotion": self.last_emotion or "neutral"
+            },
+            "raw_metrics_sample": raw_metrics_sample
+        }
+
+
+def _extend_report_state(base: Optional[_ReportState], metrics: list) -> _ReportState:
+    """Extend a copy of base (or a fresh state) with metrics"""
+    state = base.copy() if base is not None else _ReportState()
+    state.add(metrics)
+    return state
+
+
+async def _fetch_report_sample(state: _ReportState) -> list:
+    """Full unified_metrics rows for the state's sample, in sample order
+    
+    Rows fetched for an earlier version are reused, so an extended state (whose first five
+    rows never change) only fetches the rows that newly entered the tail.
+    """
+    row_ids = [row['row_id'] for row in state.sample()]
+    missing = [row_id for row_id in row_ids if row_id not in state.full_rows]
+    if missing:
+        sql = _REPORT_SAMPLE_SQL.format(placeholders=",".join("?" * len(missing)))
+        for row in await db.fetchall_async(sql, tuple(missing)):
+            state.full_rows[row['row_id']] = row
+    state.full_rows = {row_id: state.full_rows[row_id] for row_id in row_ids if row_id in state.full_rows}
+    return list(state.full_rows.values())
+
+
 @app.get("/api/report/{session_id}")
-async def get_session_report(session_id: str):
+async def get_session_report(request: Request, session_id: str):
     """Get comprehensive behavioral report for a session"""
     try:
         logger.info(f"Report request for session_id: {session_id}")
         
         # If session_id is "current", find the latest session
         if session_id == "current" or session_id == "current_session":
-            cursor = db.conn.cursor()
-            # First try unified_metrics
+            # unified_metrics first, falling back to video_metrics or audio_metrics
             try:
-                cursor.execute("""
-                    SELECT session_id, MAX(timestamp) as last_time
-                    FROM unified_metrics
-                    GROUP BY session_id
-                    ORDER BY last_time DESC
-                    LIMIT 1
-                """)
-                result = cursor.fetchone()
-                if result:
-                    session_id = result[0]
-                    logger.info(f"Found session in unified_metrics: {session_id}")
+                latest, source = await resolve_latest_session()
+                if latest:
+                    session_id = latest
+                    logger.info(f"Found session in {source}: {session_id}")
                 else:
-                    # Fallback: try video_metrics or audio_metrics
-                    cursor.execute("""
-                        SELECT session_id, MAX(timestamp) as last_time
-                        FROM video_metrics
-                        GROUP BY session_id
-                        ORDER BY last_time DESC
-                        LIMIT 1
-                    """)
-                    result = cursor.fetchone()
-                    if result:
-                        session_id = result[0]
-                        logger.info(f"Found session in video_metrics: {session_id}")
-                    else:
-                        cursor.execute("""
-                            SELECT session_id, MAX(timestamp) as last_time
-                            FROM audio_metrics
-                            GROUP BY session_id
-                            ORDER BY last_time DESC
-                            LIMIT 1
-                        """)
-                        result = cursor.fetchone()
-                        if result:
-                            session_id = result[0]
-                            logger.info(f"Found session in audio_metrics: {session_id}")
-                        else:
-                            logger.warning("No sessions found in any metrics table")
-                            raise HTTPException(status_code=404, detail="No session found in database. Please ensure BEVAL is running and collecting data.")
+                    logger.warning("No sessions found in any metrics table")
+                    raise HTTPException(status_code=404, detail="No session found in database. Please ensure BEVAL is running and collecting data.")
             except sqlite3.OperationalError as e:
                 logger.error(f"Database error while finding session: {e}")
                 raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
         
-        # Get all metrics for the session
-        cursor = db.conn.cursor()
+        # Serve the cached report if no metric has been written for the session since.
+        # With nothing cached and no client ETag the version check can't save any work,
+        # so skip it and take the version from the fetched rows instead.
+        headers = None
+        cached = _report_cache.get(session_id)
+        if cached is not None and time.monotonic() - cached[3] < _REPORT_FRESH_TTL:
+            headers = _etag_headers(session_id, cached[0])
+            if _is_not_modified(request, headers):
+                return Response(status_code=304, headers=headers)
+            _report_cache.move_to_end(session_id)
+            return Response(cached[2], media_type="application/json", headers=headers)
+        if cached is not None or "if-none-match" in request.headers:
+            try:
+                version_rows = await db.fetchall_async(_REPORT_VERSION_SQL, (session_id,))
+                version = version_rows[0][0]
+            except sqlite3.OperationalError:
+                version = None
+            # Pollers that already hold this version get an empty 304
+            headers = _etag_headers(session_id, version) if version is not None else None
+            if _is_not_modified(request, headers):
+                return Response(status_code=304, headers=headers)
+            if cached is not None and version is not None and cached[0] == version:
+                _mark_report_validated(session_id, cached)
+                return Response(cached[2], media_type="application/json", headers=headers)
+        
+        # Get the metrics written since the cached report, or all of them
+        base = None
         try:
-            cursor.execute("""
-                SELECT * FROM unified_metrics
-                WHERE session_id = ?
-                ORDER BY timestamp ASC
-            """, (session_id,))
-            
-            columns = [description[0] for description in cursor.description] if cursor.description else []
-            rows = cursor.fetchall()
-            logger.info(f"Found {len(rows)} unified_metrics for session {session_id}")
+            if cached is not None:
+                base = cached[1]
+                rows = await db.fetchall_async(_REPORT_METRICS_SINCE_SQL, (session_id, cached[0]))
+                logger.info(f"Found {len(rows)} new unified_metrics for session {session_id}")
+                if not rows:
+                    # Nothing newer after all (e.g. the version check failed); the cached report stands
+                    _mark_report_validated(session_id, cached)
+                    return Response(cached[2], media_type="application/json",
+                                    headers=_etag_headers(session_id, cached[0]))
+                last_row_id = rows[-1]['row_id']
+                # Fetched in insertion order; the aggregates fold in timestamp order
+                rows.sort(key=lambda row: row['timestamp'])
+                if rows[0]['timestamp'] < base.last_timestamp:
+                    # A new row sorts among the cached ones, so transitions and the sample
+                    # can only be right after a full rebuild
+                    logger.info(f"New unified_metrics for session {session_id} predate the cached report, rebuilding")
+                    base = None
+                    rows = await db.fetchall_async(_REPORT_METRICS_SQL, (session_id,))
+                    last_row_id = max(row['row_id'] for row in rows)
+            else:
+                rows = await db.fetchall_async(_REPORT_METRICS_SQL, (session_id,))
+                logger.info(f"Found {len(rows)} unified_metrics for session {session_id}")
+                last_row_id = max((row['row_id'] for row in rows), default=None)
         except sqlite3.OperationalError as e:
             logger.error(f"Error querying unified_metrics: {e}")
+            base = None
             rows = []
-            columns = []
         
         # If no unified_metrics, try to aggregate from video and audio metrics
         if not rows:
             logger.warning(f"No unified_metrics found for session {session_id}, trying to aggregate from individual metrics")
             
-            # Get video metrics
-            cursor.execute("""
-                SELECT * FROM video_metrics
-                WHERE session_id = ?
-                ORDER BY timestamp ASC
-            """, (session_id,))
-            video_rows = cursor.fetchall()
-            if video_rows:
-                video_columns = [description[0] for description in cursor.description]
-                video_metrics = [dict(zip(video_columns, row)) for row in video_rows]
-            else:
-                video_metrics = []
-            
-            # Get audio metrics
-            cursor.execute("""
-                SELECT * FROM audio_metrics
-                WHERE session_id = ?
-                ORDER BY timestamp ASC
-            """, (session_id,))
-            audio_rows = cursor.fetchall()
-            if audio_rows:
-                audio_columns = [description[0] for description in cursor.description]
-                audio_metrics = [dict(zip(audio_columns, row)) for row in audio_rows]
-            else:
-                audio_metrics = []
+            video_rows = await db.fetchall_async(_SYNTH_VIDEO_SQL, (session_id,))
+            audio_rows = await db.fetchall_async(_SYNTH_AUDIO_SQL, (session_id,))
             
-            if not video_metrics and not audio_metrics:
+            if not video_rows and not audio_rows:
                 logger.warning(f"No metrics found for session {session_id} in any table")
                 # Return a minimal report structure instead of 404
-                return {
+                return ORJSONResponse({
                     "session_id": session_id,
                     "total_data_points": 0,
                     "duration_seconds": 0,
@@ -357,160 +794,34 @@ async def get_session_report(session_id: str):
                     },
                     "raw_metrics_sample": [],
                     "message": "No behavioral data collected yet for this session. Please ensure BEVAL is running and collecting metrics."
-                }
-            
-            # Create synthetic unified metrics from available data
-            metrics = []
-            # Combine video and audio metrics by timestamp (simplified approach)
-            all_timestamps = set()
-            if video_metrics:
-                all_timestamps.update(m.get('timestamp', 0) for m in video_metrics)
-            if audio_metrics:
-                all_timestamps.update(m.get('timestamp', 0) for m in audio_metrics)
-            
-            for ts in sorted(all_timestamps):
-                video_m = next((m for m in video_metrics if abs(m.get('timestamp', 0) - ts) < 1), None)
-                audio_m = next((m for m in audio_metrics if abs(m.get('timestamp', 0) - ts) < 1), None)
-                
-                unified = {
-                    'session_id': session_id,
-                    'timestamp': ts,
-                    'unified_emotion': video_m.get('emotion') if video_m else audio_m.get('emotion') if audio_m else 'neutral',
-                    'unified_attention': video_m.get('attention_state') if video_m else None,
-                    'unified_posture': video_m.get('posture_state') if video_m else None,
-                    'unified_movement': video_m.get('movement_level') if video_m else None,
-                    'unified_fatigue': video_m.get('fatigue_level') if video_m else None,
-                    'unified_sentiment': audio_m.get('sentiment') if audio_m else None,
-                    'attention_score': video_m.get('attention_score') if video_m else None,
-                    'engagement_level': 'medium',
-                    'video_data': video_m,
-                    'audio_data': audio_m
-                }
-                metrics.append(unified)
-        else:
-            metrics = [dict(zip(columns, row)) for row in rows]
-        
-        # Parse JSON fields
-        for metric in metrics:
-            # Handle video_data
-            if metric.get('video_data'):
-                if isinstance(metric['video_data'], str):
-                    try:
-                        metric['video_data'] = json.loads(metric['video_data'])
-                    except:
-                        pass
-                elif isinstance(metric['video_data'], dict):
-                    # Already parsed
-                    pass
-            # Handle audio_data
-            if metric.get('audio_data'):
-                if isinstance(metric['audio_data'], str):
-                    try:
-                        metric['audio_data'] = json.loads(metric['audio_data'])
-                    except:
-                        pass
-                elif isinstance(metric['audio_data'], dict):
-                    # Already parsed
-                    pass
-            # Handle stress_indicators
-            if metric.get('stress_indicators') and isinstance(metric['stress_indicators'], str):
-                try:
-                    metric['stress_indicators'] = json.loads(metric['stress_indicators'])
-                except:
-                    pass
-        
-        # Calculate aggregated stats
-        emotions = [m.get("unified_emotion") for m in metrics if m.get("unified_emotion")]
-        sentiments = [m.get("unified_sentiment") for m in metrics if m.get("unified_sentiment") is not None]
-        attention_scores = [m.get("attention_score") for m in metrics if m.get("attention_score") is not None]
-        fatigue_levels = [m.get("unified_fatigue") for m in metrics if m.get("unified_fatigue")]
-        engagements = [m.get("engagement_level") for m in metrics if m.get("engagement_level")]
-        
-        from collections import Counter
-        
-        # Emotion distribution
-        emotion_counts = Counter(emotions)
-        emotion_distribution = {k: v for k, v in emotion_counts.most_common()}
-        
-        # Fatigue distribution
-        fatigue_counts = Counter(fatigue_levels)
-        
-        # Engagement distribution
-        engagement_counts = Counter(engagements)
-        
-        # Calculate emotion transitions
-        emotion_transitions = []
-        for i in range(1, len(emotions)):
-            if emotions[i] != emotions[i-1]:
-                emotion_transitions.append({
-                    'from': emotions[i-1],
-                    'to': emotions[i],
-                    'index': i
                 })
-        
-        # Session duration
-        if len(metrics) >= 2:
-            start_time = metrics[0].get('timestamp', 0)
-            end_time = metrics[-1].get('timestamp', 0)
-            duration_seconds = end_time - start_time
+            
+            # Create synthetic unified metrics from available data, off the event loop
+            metrics = await asyncio.get_running_loop().run_in_executor(
+                _report_pool, _synthesize_metrics, session_id, video_rows, audio_rows)
         else:
-            duration_seconds = 0
-        
-        report = {
-            "session_id": session_id,
-            "total_data_points": len(metrics),
-            "duration_seconds": duration_seconds,
-            "duration_formatted": f"{int(duration_seconds // 60)}m {int(duration_seconds % 60)}s",
-            "emotion_analysis": {
-                "distribution": emotion_distribution,
-                "dominant_emotion": emotion_counts.most_common(1)[0][0] if emotion_counts else "neutral",
-                "emotional_variety": len(set(emotions)),
-                "transitions_count": len(emotion_transitions),
-                "emotional_stability": "stable" if len(emotion_transitions) < len(emotions) * 0.2 else "moderate" if len(emotion_transitions) < len(emotions) * 0.4 else "volatile"
-            },
-            "sentiment_analysis": {
-                "average": sum(sentiments) / len(sentiments) if sentiments else 0.0,
-                "min": min(sentiments) if sentiments else 0.0,
-                "max": max(sentiments) if sentiments else 0.0,
-                "overall": (
-                    "positive" if (sentiments and sum(sentiments) / len(sentiments) > 0.2)
-                    else "negative" if (sentiments and sum(sentiments) / len(sentiments) < -0.2)
-                    else "neutral"
-                )
-            },
-            "attention_analysis": {
-                "average_score": sum(attention_scores) / len(attention_scores) if attention_scores else 50.0,
-                "min_score": min(attention_scores) if attention_scores else 0.0,
-                "max_score": max(attention_scores) if attention_scores else 100.0,
-                "attention_quality": (
-                    "excellent" if (attention_scores and sum(attention_scores) / len(attention_scores) > 80)
-                    else "good" if (attention_scores and sum(attention_scores) / len(attention_scores) > 60)
-                    else "moderate" if (attention_scores and sum(attention_scores) / len(attention_scores) > 40)
-                    else "needs_improvement"
-                )
-            },
-            "fatigue_analysis": {
-                "distribution": dict(fatigue_counts),
-                "primary_state": fatigue_counts.most_common(1)[0][0] if fatigue_counts else "Normal"
-            },
-            "engagement_analysis": {
-                "distribution": dict(engagement_counts),
-                "primary_level": engagement_counts.most_common(1)[0][0] if engagement_counts else "medium"
-            },
-            "timeline": {
-                "emotion_transitions": emotion_transitions[:10],  # First 10 transitions
-                "first_emotion": emotions[0] if emotions else "neutral",
-                "last_emotion": emotions[-1] if emotions else "neutral"
-            },
-            "raw_metrics_sample": metrics[:5] + metrics[-5:] if len(metrics) > 10 else metrics  # First and last 5
-        }
+            # sqlite3.Row gives name access without building a dict per row
+            metrics = rows
         
-        return report
+        # Aggregation is pure Python; run it off the event loop so other requests keep flowing
+        loop = asyncio.get_running_loop()
+        state = await loop.run_in_executor(_report_pool, _extend_report_state, base, metrics)
+        # Synthesized rows already carry their full sample; unified rows were fetched without JSON
+        sample = await _fetch_report_sample(state) if rows else None
+        # The report is plain JSON types, so no jsonable_encoder is needed
+        body = orjson.dumps(state.report(session_id, sample), option=orjson.OPT_NON_STR_KEYS)
+        if rows:
+            # Version the body by its own newest row so the ETag always matches what was sent
+            headers = _etag_headers(session_id, last_row_id)
+            _report_cache[session_id] = (last_row_id, state, body, time.monotonic())
+            _report_cache.move_to_end(session_id)
+            if len(_report_cache) > _REPORT_CACHE_SIZE:
+                _report_cache.popitem(last=False)
+        return Response(body, media_type="application/json", headers=headers)
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Error generating report: {e}")
-        import traceback
         logger.error(traceback.format_exc())
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -519,7 +830,7 @@ async def get_session_report(session_id: str):
 async def create_session(session_id: str, user_id: Optional[str] = None):
     """Create a new session"""
     try:
-        success = db.create_session(session_id, user_id)
+        success = await asyncio.to_thread(db.create_session, session_id, user_id)
         if success:
             return {"message": "Session created", "session_id": session_id}
         else:
@@ -529,6 +840,34 @@ async def create_session(session_id: str, user_id: Optional[str] = None):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Long report scans keep old WAL frames alive; checkpointing regularly keeps the WAL (and
+# every reader's walk through it) short
+_CHECKPOINT_INTERVAL = 30.0
+_checkpoint_task: Optional[asyncio.Task] = None
+
+
+async def _periodic_checkpoint():
+    while True:
+        await asyncio.sleep(_CHECKPOINT_INTERVAL)
+        await asyncio.to_thread(db.checkpoint)
+
+
+@app.on_event("startup")
+async def start_checkpointer():
+    """Start the periodic WAL checkpoint"""
+    global _checkpoint_task
+    _checkpoint_task = asyncio.create_task(_periodic_checkpoint())
+
+
+@app.on_event("shutdown")
+async def close_database():
+    """Stop the checkpointer, write out queued metrics and close the async read connections on shutdown"""
+    if _checkpoint_task is not None:
+        _checkpoint_task.cancel()
+    db.flush_writes()
+    await db.close_async()
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
@@ -538,7 +877,13 @@ async def health_check():
 def main():
     """Main entry point for uv script"""
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8083)
+    # One process per worker; each imports this module and opens its own database connections
+    if _API_WORKERS > 1:
+        # uvicorn[standard] ships uvloop and httptools; "auto" picks them up when importable
+        uvicorn.run("api.server:app", host="0.0.0.0", port=8083, workers=_API_WORKERS,
+                    loop="auto", http="auto")
+    else:
+        uvicorn.run(app, host="0.0.0.0", port=8083)
 
 
 if __name__ == "__main__":
@@ -11,6 +11,7 @@ async def test_beval_connection():
     print("Testing BEVAL SocketIO connection...")
     
     sio = socketio.AsyncClient()
+    received = asyncio.Event()
     
     @sio.on('connect')
     async def on_connect():
@@ -25,6 +26,7 @@ async def test_beval_connection():
             print(f"   Video emotion: {data['video'].get('emotion', 'N/A')}")
         if 'audio' in data:
             print(f"   Audio sentiment: {data['audio'].get('sentiment', 'N/A')}")
+        received.set()
     
     @sio.on('disconnect')
     async def on_disconnect(*args):
@@ -33,58 +35,17 @@ async def test_beval_connection():
     try:
         print("Connecting to http://localhost:5000...")
         await sio.connect('http://localhost:5000')
-        print("Waiting for events (10 seconds)...")
-        await asyncio.sleep(10)
-        await sio.disconnect()
-        print("[OK] Test completed successfully!")
-    except Exception as e:
-        print(f"[ERROR] Connection failed: {e}")
-        print("Make sure BEVAL Web UI is running on port 5000")
-
-if __name__ == "__main__":
-    asyncio.run(test_beval_connection())
-
-
-"""
-
-import asyncio
-import socketio
-import json
-
-async def test_beval_connection():
-    """Test SocketIO connection to BEVAL"""
-    print("Testing BEVAL SocketIO connection...")
-    
-    sio = socketio.AsyncClient()
-    
-    @sio.on('connect')
-    async def on_connect():
-        print("[OK] Connected to BEVAL SocketIO server!")
-        await sio.emit('request_data')
-    
-    @sio.on('data_update')
-    async def on_data_update(data):
-        print("[OK] Received data_update event from BEVAL!")
-        print(f"   Data keys: {list(data.keys())}")
-        if 'video' in data:
-            print(f"   Video emotion: {data['video'].get('emotion', 'N/A')}")
-        if 'audio' in data:
-            print(f"   Audio sentiment: {data['audio'].get('sentiment', 'N/A')}")
-    
-    @sio.on('disconnect')
-    async def on_disconnect(*args):
-        print("[X] Disconnected from BEVAL")
-    
-    try:
-        print("Connecting to http://localhost:5000...")
-        await sio.connect('http://localhost:5000')
-        print("Waiting for events (10 seconds)...")
-        await asyncio.sleep(10)
-        await sio.disconnect()
+        print("Waiting for events (up to 10 seconds)...")
+        await asyncio.wait_for(received.wait(), timeout=10)
         print("[OK] Test completed successfully!")
+    except TimeoutError:
+        print("[X] No data_update event received within 10 seconds")
     except Exception as e:
         print(f"[ERROR] Connection failed: {e}")
         print("Make sure BEVAL Web UI is running on port 5000")
+    finally:
+        if sio.connected:
+            await sio.disconnect()
 
 if __name__ == "__main__":
     asyncio.run(test_beval_connection())
@@ -2,449 +2,196 @@
 Check if all BEVAL metrics are being captured by FUSION
 """
 
+import functools
+import os
 import sqlite3
 import json
-from typing import Dict, Set, List
+from typing import Optional
 
-def get_beval_metrics_structure() -> Dict[str, List[str]]:
-    """Expected BEVAL metrics structure based on code analysis"""
-    return {
-        "video": [
-            "emotion",
-            "emotion_scores",
-            "attention_state",
-            "posture_state",
-            "movement_level",
-            "blink_rate",
-            "total_blinks",
-            "ear",  # Eye Aspect Ratio
-            "ear_threshold",
-            "eye_asymmetry",
-            "blink_duration",
-            "blink_interval",
-            "fatigue_level",
-            "drowsiness_score",
-            "fps",
-            "object_detections",
-            "person_tracking",
-            "main_person",
-            "current_detections"
-        ],
-        "audio": [
-            "transcription",
-            "emotion",
-            "sentiment",
-            "confidence",
-            "confidence_label",
-            "energy",
-            "pitch",
-            "speech_rate",
-            "silence_ratio",
-            "energy_z_score",
-            "pitch_z_score",
-            "rate_z_score",
-            "chunk_duration",
-            "sample_rate",
-            "word_count",
-            "total_words",
-            "audio_features",
-            "session_stats"
-        ],
-        "objects": [
-            "detections",
-            "tracking_data"
-        ],
-        "session_stats": [
-            "session_duration",
-            "total_frames",
-            "total_audio_chunks",
-            "avg_fps",
-            "avg_attention_score"
-        ]
-    }
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
-def get_fusion_schema_fields() -> Dict[str, List[str]]:
-    """FUSION database schema fields"""
-    return {
-        "video_metrics": [
-            "emotion",
-            "emotion_scores",
-            "attention_state",
-            "posture_state",
-            "movement_level",
-            "blink_rate",
-            "total_blinks",
-            "ear",
-            "ear_threshold",
-            "eye_asymmetry",
-            "blink_duration",
-            "blink_interval",
-            "fatigue_level",
-            "drowsiness_score",
-            "fps",
-            "object_detections",
-            "person_tracking"
-        ],
-        "audio_metrics": [
-            "transcription",
-            "emotion",
-            "sentiment",
-            "confidence",
-            "energy",
-            "pitch",
-            "speech_rate",
-            "silence_ratio",
-            "energy_z_score",
-            "pitch_z_score",
-            "rate_z_score",
-            "chunk_duration",
-            "sample_rate",
-            "word_count"
-        ],
-        "unified_metrics": [
-            "unified_emotion",
-            "unified_attention",
-            "unified_posture",
-            "unified_movement",
-            "unified_fatigue",
-            "unified_sentiment",
-            "unified_confidence",
-            "attention_score",
-            "engagement_level",
-            "stress_indicators",
-            "confidence_level",
-            "video_data",  # JSON string containing all video data
-            "audio_data"   # JSON string containing all audio data
-        ]
-    }
+# Expected BEVAL metrics structure based on code analysis
+BEVAL_VIDEO = frozenset({
+    "emotion",
+    "emotion_scores",
+    "attention_state",
+    "posture_state",
+    "movement_level",
+    "blink_rate",
+    "total_blinks",
+    "ear",  # Eye Aspect Ratio
+    "ear_threshold",
+    "eye_asymmetry",
+    "blink_duration",
+    "blink_interval",
+    "fatigue_level",
+    "drowsiness_score",
+    "fps",
+    "object_detections",
+    "person_tracking",
+    "main_person",
+    "current_detections"
+})
+BEVAL_AUDIO = frozenset({
+    "transcription",
+    "emotion",
+    "sentiment",
+    "confidence",
+    "confidence_label",
+    "energy",
+    "pitch",
+    "speech_rate",
+    "silence_ratio",
+    "energy_z_score",
+    "pitch_z_score",
+    "rate_z_score",
+    "chunk_duration",
+    "sample_rate",
+    "word_count",
+    "total_words",
+    "audio_features",
+    "session_stats"
+})
+BEVAL_OBJECTS = frozenset({
+    "detections",
+    "tracking_data"
+})
+BEVAL_SESSION_STATS = frozenset({
+    "session_duration",
+    "total_frames",
+    "total_audio_chunks",
+    "avg_fps",
+    "avg_attention_score"
+})
 
-def check_actual_data(db_path: str = "fusion.db"):
-    """Check what's actually in the database"""
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    
-    # Get latest unified metric
-    cursor.execute("""
-        SELECT video_data, audio_data 
-        FROM unified_metrics 
-        ORDER BY timestamp DESC 
-        LIMIT 1
-    """)
-    row = cursor.fetchone()
-    
-    if not row or not row[0]:
-        print("No data found in database")
-        conn.close()
-        return None, None
-    
-    video_data = json.loads(row[0]) if row[0] else {}
-    audio_data = json.loads(row[1]) if row[1] else {}
-    
-    conn.close()
-    return video_data, audio_data
+# FUSION database schema fields
+FUSION_VIDEO = frozenset({
+    "emotion",
+    "emotion_scores",
+    "attention_state",
+    "posture_state",
+    "movement_level",
+    "blink_rate",
+    "total_blinks",
+    "ear",
+    "ear_threshold",
+    "eye_asymmetry",
+    "blink_duration",
+    "blink_interval",
+    "fatigue_level",
+    "drowsiness_score",
+    "fps",
+    "object_detections",
+    "person_tracking"
+})
+FUSION_AUDIO = frozenset({
+    "transcription",
+    "emotion",
+    "sentiment",
+    "confidence",
+    "energy",
+    "pitch",
+    "speech_rate",
+    "silence_ratio",
+    "energy_z_score",
+    "pitch_z_score",
+    "rate_z_score",
+    "chunk_duration",
+    "sample_rate",
+    "word_count"
+})
+FUSION_UNIFIED = frozenset({
+    "unified_emotion",
+    "unified_attention",
+    "unified_posture",
+    "unified_movement",
+    "unified_fatigue",
+    "unified_sentiment",
+    "unified_confidence",
+    "attention_score",
+    "engagement_level",
+    "stress_indicators",
+    "confidence_level",
+    "video_data",  # JSON string containing all video data
+    "audio_data"   # JSON string containing all audio data
+})
 
-def compare_metrics():
-    """Compare BEVAL metrics vs FUSION capture"""
-    print("=" * 70)
-    print("BEVAL Metrics Coverage Analysis")
-    print("=" * 70)
-    
-    beval_metrics = get_beval_metrics_structure()
-    fusion_schema = get_fusion_schema_fields()
-    actual_video, actual_audio = check_actual_data()
-    
-    print("\n1. VIDEO METRICS")
-    print("-" * 70)
-    
-    beval_video = set(beval_metrics["video"])
-    fusion_video = set(fusion_schema["video_metrics"])
-    actual_video_keys = set(actual_video.keys()) if actual_video else set()
-    
-    # Metrics in BEVAL but not in FUSION schema
-    missing_in_schema = beval_video - fusion_video
-    if missing_in_schema:
-        print(f"[WARN] Missing in FUSION schema: {sorted(missing_in_schema)}")
-    else:
-        print("[OK] All BEVAL video metrics are in FUSION schema")
-    
-    # Metrics in schema but not captured
-    in_schema_not_captured = fusion_video - actual_video_keys
-    if in_schema_not_captured:
-        print(f"[WARN] In schema but not captured: {sorted(in_schema_not_captured)}")
-    else:
-        print("[OK] All schema fields are being captured")
-    
-    # Metrics captured but not in schema
-    captured_not_in_schema = actual_video_keys - fusion_video
-    if captured_not_in_schema:
-        print(f"[INFO] Captured but not in schema (stored in JSON): {sorted(captured_not_in_schema)}")
-    
-    print(f"\n   BEVAL video metrics: {len(beval_video)}")
-    print(f"   FUSION schema fields: {len(fusion_video)}")
-    print(f"   Actually captured: {len(actual_video_keys)}")
-    
-    print("\n2. AUDIO METRICS")
-    print("-" * 70)
-    
-    beval_audio = set(beval_metrics["audio"])
-    fusion_audio = set(fusion_schema["audio_metrics"])
-    actual_audio_keys = set(actual_audio.keys()) if actual_audio else set()
-    
-    # Handle nested audio_features
-    if actual_audio and "audio_features" in actual_audio:
-        if isinstance(actual_audio["audio_features"], dict):
-            actual_audio_keys.update(actual_audio["audio_features"].keys())
-    
-    missing_in_schema = beval_audio - fusion_audio
-    if missing_in_schema:
-        print(f"[WARN] Missing in FUSION schema: {sorted(missing_in_schema)}")
-    else:
-        print("[OK] All BEVAL audio metrics are in FUSION schema")
-    
-    in_schema_not_captured = fusion_audio - actual_audio_keys
-    if in_schema_not_captured:
-        print(f"[WARN] In schema but not captured: {sorted(in_schema_not_captured)}")
-    else:
-        print("[OK] All schema fields are being captured")
-    
-    captured_not_in_schema = actual_audio_keys - fusion_audio
-    if captured_not_in_schema:
-        print(f"[INFO] Captured but not in schema (stored in JSON): {sorted(captured_not_in_schema)}")
-    
-    print(f"\n   BEVAL audio metrics: {len(beval_audio)}")
-    print(f"   FUSION schema fields: {len(fusion_audio)}")
-    print(f"   Actually captured: {len(actual_audio_keys)}")
-    
-    print("\n3. ADDITIONAL BEVAL DATA")
-    print("-" * 70)
-    
-    # Check for objects and session_stats
-    beval_objects = beval_metrics.get("objects", [])
-    beval_session_stats = beval_metrics.get("session_stats", [])
-    
-    print(f"   Objects data: {len(beval_objects)} fields")
-    print(f"   Session stats: {len(beval_session_stats)} fields")
-    
-    if actual_audio and "session_stats" in actual_audio:
-        print(f"   [OK] Session stats captured in audio_data JSON")
-    else:
-        print(f"   [WARN] Session stats not found in captured data")
-    
-    print("\n4. SUMMARY")
-    print("-" * 70)
-    
-    # Calculate coverage
-    video_coverage = len(actual_video_keys & fusion_video) / len(fusion_video) * 100 if fusion_video else 0
-    audio_coverage = len(actual_audio_keys & fusion_audio) / len(fusion_audio) * 100 if fusion_audio else 0
-    
-    print(f"   Video metrics coverage: {video_coverage:.1f}%")
-    print(f"   Audio metrics coverage: {audio_coverage:.1f}%")
-    
-    # Check if all critical metrics are captured
-    critical_video = {"emotion", "attention_state", "posture_state", "fatigue_level"}
-    critical_audio = {"transcription", "sentiment", "emotion", "confidence"}
-    
-    critical_video_captured = critical_video.issubset(actual_video_keys) if actual_video else False
-    critical_audio_captured = critical_audio.issubset(actual_audio_keys) if actual_audio else False
-    
-    if critical_video_captured and critical_audio_captured:
-        print("   [OK] All critical metrics are captured")
-    else:
-        missing_critical = []
-        if not critical_video_captured:
-            missing_critical.extend(critical_video - (actual_video_keys if actual_video else set()))
-        if not critical_audio_captured:
-            missing_critical.extend(critical_audio - (actual_audio_keys if actual_audio else set()))
-        print(f"   [WARN] Missing critical metrics: {missing_critical}")
-    
-    print("\n" + "=" * 70)
-    
-    # Detailed breakdown
-    if actual_video:
-        print("\n5. ACTUAL VIDEO DATA KEYS:")
-        print("-" * 70)
-        for key in sorted(actual_video.keys()):
-            value_type = type(actual_video[key]).__name__
-            print(f"   {key}: {value_type}")
-    
-    if actual_audio:
-        print("\n6. ACTUAL AUDIO DATA KEYS:")
-        print("-" * 70)
-        for key in sorted(actual_audio.keys()):
-            value_type = type(actual_audio[key]).__name__
-            if isinstance(actual_audio[key], dict):
-                print(f"   {key}: dict with keys {list(actual_audio[key].keys())}")
-            else:
-                print(f"   {key}: {value_type}")
-
-if __name__ == "__main__":
-    compare_metrics()
+# Static comparisons, independent of what is in the database
+MISSING_IN_SCHEMA_VIDEO = BEVAL_VIDEO - FUSION_VIDEO
+MISSING_IN_SCHEMA_AUDIO = BEVAL_AUDIO - FUSION_AUDIO
 
+CRITICAL_VIDEO = frozenset({"emotion", "attention_state", "posture_state", "fatigue_level"})
+CRITICAL_AUDIO = frozenset({"transcription", "sentiment", "emotion", "confidence"})
 
+_LATEST_BLOBS_SQL = """
+    SELECT video_data, audio_data 
+    FROM unified_metrics 
+    ORDER BY timestamp DESC 
+    LIMIT 1
 """
 
-import sqlite3
-import json
-from typing import Dict, Set, List
-
-def get_beval_metrics_structure() -> Dict[str, List[str]]:
-    """Expected BEVAL metrics structure based on code analysis"""
-    return {
-        "video": [
-            "emotion",
-            "emotion_scores",
-            "attention_state",
-            "posture_state",
-            "movement_level",
-            "blink_rate",
-            "total_blinks",
-            "ear",  # Eye Aspect Ratio
-            "ear_threshold",
-            "eye_asymmetry",
-            "blink_duration",
-            "blink_interval",
-            "fatigue_level",
-            "drowsiness_score",
-            "fps",
-            "object_detections",
-            "person_tracking",
-            "main_person",
-            "current_detections"
-        ],
-        "audio": [
-            "transcription",
-            "emotion",
-            "sentiment",
-            "confidence",
-            "confidence_label",
-            "energy",
-            "pitch",
-            "speech_rate",
-            "silence_ratio",
-            "energy_z_score",
-            "pitch_z_score",
-            "rate_z_score",
-            "chunk_duration",
-            "sample_rate",
-            "word_count",
-            "total_words",
-            "audio_features",
-            "session_stats"
-        ],
-        "objects": [
-            "detections",
-            "tracking_data"
-        ],
-        "session_stats": [
-            "session_duration",
-            "total_frames",
-            "total_audio_chunks",
-            "avg_fps",
-            "avg_attention_score"
-        ]
-    }
-
-def get_fusion_schema_fields() -> Dict[str, List[str]]:
-    """FUSION database schema fields"""
-    return {
-        "video_metrics": [
-            "emotion",
-            "emotion_scores",
-            "attention_state",
-            "posture_state",
-            "movement_level",
-            "blink_rate",
-            "total_blinks",
-            "ear",
-            "ear_threshold",
-            "eye_asymmetry",
-            "blink_duration",
-            "blink_interval",
-            "fatigue_level",
-            "drowsiness_score",
-            "fps",
-            "object_detections",
-            "person_tracking"
-        ],
-        "audio_metrics": [
-            "transcription",
-            "emotion",
-            "sentiment",
-            "confidence",
-            "energy",
-            "pitch",
-            "speech_rate",
-            "silence_ratio",
-            "energy_z_score",
-            "pitch_z_score",
-            "rate_z_score",
-            "chunk_duration",
-            "sample_rate",
-            "word_count"
-        ],
-        "unified_metrics": [
-            "unified_emotion",
-            "unified_attention",
-            "unified_posture",
-            "unified_movement",
-            "unified_fatigue",
-            "unified_sentiment",
-            "unified_confidence",
-            "attention_score",
-            "engagement_level",
-            "stress_indicators",
-            "confidence_level",
-            "video_data",  # JSON string containing all video data
-            "audio_data"   # JSON string containing all audio data
-        ]
-    }
-
-def check_actual_data(db_path: str = "fusion.db"):
-    """Check what's actually in the database"""
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    
-    # Get latest unified metric
-    cursor.execute("""
-        SELECT video_data, audio_data 
-        FROM unified_metrics 
-        ORDER BY timestamp DESC 
-        LIMIT 1
-    """)
-    row = cursor.fetchone()
-    
+def _parse_blobs(row):
+    """Parse a (video_data, audio_data) row, or (None, None) when there is no data"""
     if not row or not row[0]:
         print("No data found in database")
-        conn.close()
         return None, None
     
-    video_data = json.loads(row[0]) if row[0] else {}
-    audio_data = json.loads(row[1]) if row[1] else {}
-    
-    conn.close()
+    video_data = _json_loads(row[0]) if row[0] else {}
+    audio_data = _json_loads(row[1]) if row[1] else {}
     return video_data, audio_data
 
+def _db_signature(db_path: str) -> tuple:
+    """mtimes of the database and its WAL file; changes whenever a write lands"""
+    signature = []
+    for path in (db_path, db_path + "-wal"):
+        try:
+            signature.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            signature.append(None)
+    return tuple(signature)
+
+@functools.lru_cache(maxsize=8)
+def _latest_blobs(db_path: str, signature: tuple):
+    """Latest (video_data, audio_data) row; signature only keys the cache"""
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute(_LATEST_BLOBS_SQL).fetchone()
+    finally:
+        conn.close()
+
+def check_actual_data(db_path: str = "fusion.db", conn: Optional[sqlite3.Connection] = None):
+    """Check what's actually in the database
+    
+    Reuses conn when given; otherwise the row is cached until the database file changes.
+    """
+    if conn is not None:
+        row = conn.execute(_LATEST_BLOBS_SQL).fetchone()
+    else:
+        row = _latest_blobs(db_path, _db_signature(db_path))
+    return _parse_blobs(row)
+
 def compare_metrics():
     """Compare BEVAL metrics vs FUSION capture"""
     print("=" * 70)
     print("BEVAL Metrics Coverage Analysis")
     print("=" * 70)
     
-    beval_metrics = get_beval_metrics_structure()
-    fusion_schema = get_fusion_schema_fields()
     actual_video, actual_audio = check_actual_data()
     
     print("\n1. VIDEO METRICS")
     print("-" * 70)
     
-    beval_video = set(beval_metrics["video"])
-    fusion_video = set(fusion_schema["video_metrics"])
+    beval_video = BEVAL_VIDEO
+    fusion_video = FUSION_VIDEO
     actual_video_keys = set(actual_video.keys()) if actual_video else set()
     
     # Metrics in BEVAL but not in FUSION schema
-    missing_in_schema = beval_video - fusion_video
-    if missing_in_schema:
-        print(f"[WARN] Missing in FUSION schema: {sorted(missing_in_schema)}")
+    if MISSING_IN_SCHEMA_VIDEO:
+        print(f"[WARN] Missing in FUSION schema: {sorted(MISSING_IN_SCHEMA_VIDEO)}")
     else:
         print("[OK] All BEVAL video metrics are in FUSION schema")
     
@@ -467,8 +214,8 @@ def compare_metrics():
     print("\n2. AUDIO METRICS")
     print("-" * 70)
     
-    beval_audio = set(beval_metrics["audio"])
-    fusion_audio = set(fusion_schema["audio_metrics"])
+    beval_audio = BEVAL_AUDIO
+    fusion_audio = FUSION_AUDIO
     actual_audio_keys = set(actual_audio.keys()) if actual_audio else set()
     
     # Handle nested audio_features
@@ -476,9 +223,8 @@ def compare_metrics():
         if isinstance(actual_audio["audio_features"], dict):
             actual_audio_keys.update(actual_audio["audio_features"].keys())
     
-    missing_in_schema = beval_audio - fusion_audio
-    if missing_in_schema:
-        print(f"[WARN] Missing in FUSION schema: {sorted(missing_in_schema)}")
+    if MISSING_IN_SCHEMA_AUDIO:
+        print(f"[WARN] Missing in FUSION schema: {sorted(MISSING_IN_SCHEMA_AUDIO)}")
     else:
         print("[OK] All BEVAL audio metrics are in FUSION schema")
     
@@ -500,11 +246,8 @@ def compare_metrics():
     print("-" * 70)
     
     # Check for objects and session_stats
-    beval_objects = beval_metrics.get("objects", [])
-    beval_session_stats = beval_metrics.get("session_stats", [])
-    
-    print(f"   Objects data: {len(beval_objects)} fields")
-    print(f"   Session stats: {len(beval_session_stats)} fields")
+    print(f"   Objects data: {len(BEVAL_OBJECTS)} fields")
+    print(f"   Session stats: {len(BEVAL_SESSION_STATS)} fields")
     
     if actual_audio and "session_stats" in actual_audio:
         print(f"   [OK] Session stats captured in audio_data JSON")
@@ -522,20 +265,17 @@ def compare_metrics():
     print(f"   Audio metrics coverage: {audio_coverage:.1f}%")
     
     # Check if all critical metrics are captured
-    critical_video = {"emotion", "attention_state", "posture_state", "fatigue_level"}
-    critical_audio = {"transcription", "sentiment", "emotion", "confidence"}
-    
-    critical_video_captured = critical_video.issubset(actual_video_keys) if actual_video else False
-    critical_audio_captured = critical_audio.issubset(actual_audio_keys) if actual_audio else False
+    critical_video_captured = CRITICAL_VIDEO.issubset(actual_video_keys) if actual_video else False
+    critical_audio_captured = CRITICAL_AUDIO.issubset(actual_audio_keys) if actual_audio else False
     
     if critical_video_captured and critical_audio_captured:
         print("   [OK] All critical metrics are captured")
     else:
         missing_critical = []
         if not critical_video_captured:
-            missing_critical.extend(critical_video - (actual_video_keys if actual_video else set()))
+            missing_critical.extend(CRITICAL_VIDEO - (actual_video_keys if actual_video else set()))
         if not critical_audio_captured:
-            missing_critical.extend(critical_audio - (actual_audio_keys if actual_audio else set()))
+            missing_critical.extend(CRITICAL_AUDIO - (actual_audio_keys if actual_audio else set()))
         print(f"   [WARN] Missing critical metrics: {missing_critical}")
     
     print("\n" + "=" * 70)
@@ -2,18 +2,49 @@
 Database models for FUSION metrics storage
 """
 
+import atexit
 import sqlite3
 import json
 import time
-from typing import Dict, List, Optional, Any
+import asyncio
+import queue
+import threading
+from contextlib import ExitStack, asynccontextmanager, contextmanager
+from typing import Dict, Iterator, List, Optional, Any
 from dataclasses import dataclass, asdict
-from datetime import datetime
 import logging
+from pathlib import Path
+
+try:
+    import aiosqlite
+    AIOSQLITE_AVAILABLE = True
+except ImportError:
+    AIOSQLITE_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _json_dumps(value: Any) -> str:
+    """Encode a JSON column value, with orjson when it is installed
+    
+    Values that are already encoded (str, or bytes from orjson) are stored as-is.
+    """
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (bytes, bytearray)):
+        return value.decode()
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(value)
+
+
+@dataclass(slots=True)
 class VideoMetric:
     """Video analysis metric"""
     session_id: str
@@ -37,7 +68,7 @@ class VideoMetric:
     person_tracking: Optional[Dict] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioMetric:
     """Audio analysis metric"""
     session_id: str
@@ -58,7 +89,7 @@ class AudioMetric:
     word_count: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class UnifiedMetric:
     """Combined video+audio metric"""
     session_id: str
@@ -78,13 +109,181 @@ class UnifiedMetric:
     audio_data: Optional[Dict] = None
 
 
+# Resolved from this file so the database can be created from any working directory
+_SCHEMA_PATH = Path(__file__).parent / 'schema.sql'
+
+_MMAP_SIZE = 1 << 30  # 1GB of address space; only touched pages are resident
+
+# Applied to every read connection; WAL itself is persistent and set by the writer in _init_db
+_READ_PRAGMAS = (
+    'PRAGMA busy_timeout=30000',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA cache_size=-64000',  # 64MB
+    f'PRAGMA mmap_size={_MMAP_SIZE}',
+    'PRAGMA query_only=1',
+)
+
+
+# Trailing key columns make the indexes covering: the latest-session lookup reads session_id,
+# and the aggregate window and report scans read their scalar columns straight from the index
+_INDEXES = {
+    'unified_metrics': {
+        'idx_unified_metrics_ts_sid': 'timestamp DESC, session_id',
+        'idx_unified_metrics_report_cov': ('session_id, timestamp, unified_emotion, unified_sentiment, '
+                                           'attention_score, unified_fatigue, engagement_level'),
+        # Every index entry ends in the rowid, so this serves the report's MAX(rowid) version
+        # check and its since-rowid scan as seeks
+        'idx_unified_metrics_sid': 'session_id',
+    },
+    'video_metrics': {
+        'idx_video_metrics_ts_sid': 'timestamp DESC, session_id',
+        'idx_video_metrics_sid_ts': 'session_id, timestamp',
+    },
+    'audio_metrics': {
+        'idx_audio_metrics_ts_sid': 'timestamp DESC, session_id',
+        'idx_audio_metrics_sid_ts': 'session_id, timestamp',
+    },
+}
+# Older single-purpose indexes now covered by a prefix of the ones above
+_SUPERSEDED_INDEXES = (
+    'idx_unified_metrics_ts', 'idx_unified_metrics_sid_ts', 'idx_unified_metrics_sid_ts_cov',
+    'idx_video_metrics_ts', 'idx_audio_metrics_ts',
+)
+
+
+def _insert_sql(table: str, columns: tuple) -> str:
+    """Single-line INSERT with one placeholder per column"""
+    return f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+
+
+# Column order matches the MetricsDatabase._*_params tuples
+_INSERT_VIDEO_SQL = _insert_sql('video_metrics', (
+    'session_id', 'timestamp', 'emotion', 'emotion_scores', 'attention_state',
+    'posture_state', 'movement_level', 'blink_rate', 'total_blinks', 'ear',
+    'ear_threshold', 'eye_asymmetry', 'blink_duration', 'blink_interval',
+    'fatigue_level', 'drowsiness_score', 'fps', 'object_detections', 'person_tracking',
+))
+_INSERT_AUDIO_SQL = _insert_sql('audio_metrics', (
+    'session_id', 'timestamp', 'transcription', 'emotion', 'sentiment', 'confidence',
+    'energy', 'pitch', 'speech_rate', 'silence_ratio', 'energy_z_score',
+    'pitch_z_score', 'rate_z_score', 'chunk_duration', 'sample_rate', 'word_count',
+))
+_INSERT_UNIFIED_SQL = _insert_sql('unified_metrics', (
+    'session_id', 'timestamp', 'unified_emotion', 'unified_attention',
+    'unified_posture', 'unified_movement', 'unified_fatigue', 'unified_sentiment',
+    'unified_confidence', 'attention_score', 'engagement_level', 'stress_indicators',
+    'confidence_level', 'video_data', 'audio_data',
+))
+
+
+class SqlitePool:
+    """Fixed-size pool of read-only SQLite connections
+    
+    The writer keeps its own connection; WAL mode lets these readers run alongside it
+    without taking turns on a single shared connection.
+    """
+    
+    def __init__(self, db_path: str, size: int = 4):
+        self._connections = queue.Queue()
+        for _ in range(size):
+            self._connections.put(self._connect(db_path))
+    
+    @staticmethod
+    def _connect(db_path: str) -> sqlite3.Connection:
+        conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None, timeout=30.0,
+                               cached_statements=256)
+        conn.row_factory = sqlite3.Row
+        for pragma in _READ_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+    
+    @contextmanager
+    def acquire(self):
+        """Borrow a connection for the duration of the with-block"""
+        conn = self._connections.get()
+        try:
+            yield conn
+        finally:
+            self._connections.put(conn)
+    
+    def close(self):
+        """Close every pooled connection"""
+        while True:
+            try:
+                self._connections.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+class AsyncSqlitePool:
+    """Bounded pool of aiosqlite read connections, opened on first use
+    
+    Each aiosqlite connection runs on its own thread, so concurrent requests read in
+    parallel instead of queueing behind a single connection.
+    """
+    
+    def __init__(self, db_path: str, size: int = 4):
+        self.db_path = db_path
+        self._slots = asyncio.Semaphore(size)
+        self._idle = []
+    
+    async def _connect(self):
+        conn = await aiosqlite.connect(self.db_path, timeout=30.0)
+        conn.row_factory = sqlite3.Row
+        for pragma in _READ_PRAGMAS:
+            await conn.execute(pragma)
+        return conn
+    
+    @asynccontextmanager
+    async def acquire(self):
+        """Borrow a connection for the duration of the async with-block"""
+        async with self._slots:
+            conn = self._idle.pop() if self._idle else await self._connect()
+            try:
+                yield conn
+            finally:
+                self._idle.append(conn)
+    
+    async def close(self):
+        """Close every idle connection"""
+        while self._idle:
+            await self._idle.pop().close()
+
+
 class MetricsDatabase:
     """Database manager for behavioral metrics"""
     
-    def __init__(self, db_path: str = "fusion.db"):
+    def __init__(self, db_path: str = "fusion.db", read_pool_size: int = 4,
+                 write_batch_size: int = 40, write_flush_interval: float = 0.1,
+                 max_pending: int = 1024, current_metrics_ttl: float = 0.25):
         self.db_path = db_path
         self.conn = None
+        # Single-row saves are queued and written by a background thread with executemany(),
+        # one commit per batch, when a table's queue fills or every write_flush_interval seconds
+        self.write_batch_size = write_batch_size
+        self.write_flush_interval = write_flush_interval
+        self.max_pending = max_pending
+        self._flush_now = threading.Event()
+        self._pending = {}
+        self._buffer_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._closing = threading.Event()
+        self._flusher = None
+        # Set while the last background batch failed; queued saves report it as False
+        self._write_failed = False
+        # session_id -> (expiry, latest unified row); the collector writes from another
+        # process, so entries expire rather than relying on invalidation by local writes
+        self.current_metrics_ttl = current_metrics_ttl
+        self._current_cache = {}
         self._init_db()
+        # Reads go through the pools; self.conn is kept for writes. An in-memory database
+        # only exists on self.conn, so it is never pooled.
+        pooled = db_path != ':memory:'
+        self.read_pool = SqlitePool(db_path, read_pool_size) if pooled else None
+        self.async_pool = AsyncSqlitePool(db_path, read_pool_size) if pooled and AIOSQLITE_AVAILABLE else None
+        # The flusher is a daemon thread, so write out whatever is still queued at exit
+        atexit.register(self.flush_writes)
     
     def _init_db(self):
         """Initialize database connection and create tables"""
@@ -97,7 +296,11 @@ class MetricsDatabase:
                 self.conn = sqlite3.connect(
                     self.db_path, 
                     check_same_thread=False,
-                    timeout=30.0  # 30 second timeout for operations
+                    timeout=30.0,  # 30 second timeout for operations
+                    cached_statements=256,  # Keep the fixed insert/query statements compiled
+                    # Implicit write transactions take the write lock up front instead of
+                    # failing with "database is locked" when upgrading from a read lock
+                    isolation_level='IMMEDIATE'
                 )
                 self.conn.row_factory = sqlite3.Row
                 
@@ -105,6 +308,10 @@ class MetricsDatabase:
                 self.conn.execute('PRAGMA busy_timeout=30000')  # 30 seconds
                 self.conn.commit()
                 
+                # page_size only sticks on a brand-new database, before WAL is enabled
+                if self.conn.execute('PRAGMA page_count').fetchone()[0] == 0:
+                    self.conn.execute('PRAGMA page_size=8192')
+                
                 # Try to enable WAL mode (may fail if database is locked, that's OK)
                 try:
                     result = self.conn.execute('PRAGMA journal_mode=WAL').fetchone()
@@ -122,6 +329,12 @@ class MetricsDatabase:
                 try:
                     self.conn.execute('PRAGMA synchronous=NORMAL')
                     self.conn.execute('PRAGMA cache_size=-64000')  # 64MB cache
+                    self.conn.execute('PRAGMA temp_store=MEMORY')
+                    # Startup index builds and ANALYZE scan whole tables here; API reads,
+                    # including the streamed range scans, get mmap from _READ_PRAGMAS
+                    self.conn.execute(f'PRAGMA mmap_size={_MMAP_SIZE}')
+                    # Checkpoint every 1000 pages so the WAL stays bounded between bursts
+                    self.conn.execute('PRAGMA wal_autocheckpoint=1000')
                     self.conn.commit()
                 except sqlite3.OperationalError:
                     # If locked, these can wait
@@ -134,13 +347,12 @@ class MetricsDatabase:
                     table_exists = cursor.fetchone() is not None
                     
                     if not table_exists:
-                        with open('db/schema.sql', 'r') as f:
-                            schema = f.read()
-                            self.conn.executescript(schema)
-                            self.conn.commit()
-                            logger.info("Database schema created")
+                        self.conn.executescript(_SCHEMA_PATH.read_text())
+                        self.conn.commit()
+                        logger.info("Database schema created")
                     else:
                         logger.debug("Database schema already exists")
+                    self._ensure_indexes()
                 except sqlite3.OperationalError as e:
                     if "database is locked" in str(e) and attempt < max_retries - 1:
                         self.conn.close()
@@ -181,15 +393,41 @@ class MetricsDatabase:
         # If we get here, all retries failed
         raise sqlite3.OperationalError("Database initialization failed after all retries")
     
+    def _ensure_indexes(self):
+        """Create the indexes the API's latest-row, range and window-aggregate queries rely on"""
+        # IF NOT EXISTS keeps concurrent initializers (e.g. several API workers) from
+        # racing; the index count tells whether this one actually created any
+        count_sql = "SELECT COUNT(*) FROM sqlite_master WHERE type='index'"
+        before = self.conn.execute(count_sql).fetchone()[0]
+        for table, indexes in _INDEXES.items():
+            for name, columns in indexes.items():
+                try:
+                    self.conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table}({columns})")
+                except sqlite3.OperationalError as e:
+                    if "no such table" not in str(e):
+                        raise
+                    logger.debug(f"Skipping index on missing table {table}")
+                    break
+        created = self.conn.execute(count_sql).fetchone()[0] > before
+        for name in _SUPERSEDED_INDEXES:
+            self.conn.execute(f"DROP INDEX IF EXISTS {name}")
+        if created:
+            # Refresh planner statistics so the new indexes are picked up
+            self.conn.execute("ANALYZE")
+        else:
+            self.conn.execute("PRAGMA optimize")
+        self.conn.commit()
+    
     def create_session(self, session_id: str, user_id: Optional[str] = None) -> bool:
         """Create a new session"""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute(
-                "INSERT INTO sessions (session_id, user_id, start_time) VALUES (?, ?, ?)",
-                (session_id, user_id, datetime.now().timestamp())
-            )
-            self.conn.commit()
+            with self._write_lock:
+                cursor = self.conn.cursor()
+                cursor.execute(
+                    "INSERT INTO sessions (session_id, user_id, start_time) VALUES (?, ?, ?)",
+                    (session_id, user_id, time.time())
+                )
+                self.conn.commit()
             return True
         except sqlite3.IntegrityError:
             logger.warning(f"Session {session_id} already exists")
@@ -198,133 +436,173 @@ class MetricsDatabase:
             logger.error(f"Error creating session: {e}")
             return False
     
+    @staticmethod
+    def _video_params(metric: VideoMetric) -> tuple:
+        return (
+            metric.session_id, metric.timestamp, metric.emotion,
+            _json_dumps(metric.emotion_scores) if metric.emotion_scores else None,
+            metric.attention_state, metric.posture_state, metric.movement_level,
+            metric.blink_rate, metric.total_blinks, metric.ear, metric.ear_threshold,
+            metric.eye_asymmetry, metric.blink_duration, metric.blink_interval,
+            metric.fatigue_level, metric.drowsiness_score, metric.fps,
+            _json_dumps(metric.object_detections) if metric.object_detections else None,
+            _json_dumps(metric.person_tracking) if metric.person_tracking else None
+        )
+    
+    @staticmethod
+    def _audio_params(metric: AudioMetric) -> tuple:
+        return (
+            metric.session_id, metric.timestamp, metric.transcription,
+            metric.emotion, metric.sentiment, metric.confidence,
+            metric.energy, metric.pitch, metric.speech_rate, metric.silence_ratio,
+            metric.energy_z_score, metric.pitch_z_score, metric.rate_z_score,
+            metric.chunk_duration, metric.sample_rate, metric.word_count
+        )
+    
+    @staticmethod
+    def _unified_params(metric: UnifiedMetric) -> tuple:
+        return (
+            metric.session_id, metric.timestamp, metric.unified_emotion,
+            metric.unified_attention, metric.unified_posture, metric.unified_movement,
+            metric.unified_fatigue, metric.unified_sentiment, metric.unified_confidence,
+            metric.attention_score, metric.engagement_level,
+            _json_dumps(metric.stress_indicators) if metric.stress_indicators else None,
+            metric.confidence_level,
+            _json_dumps(metric.video_data) if metric.video_data else None,
+            _json_dumps(metric.audio_data) if metric.audio_data else None
+        )
+    
     def save_video_metric(self, metric: VideoMetric) -> bool:
-        """Save a video metric with retry logic"""
-        max_retries = 3
-        retry_delay = 0.1
-        
-        for attempt in range(max_retries):
-            try:
-                cursor = self.conn.cursor()
-                cursor.execute("""
-                    INSERT INTO video_metrics (
-                        session_id, timestamp, emotion, emotion_scores, attention_state,
-                        posture_state, movement_level, blink_rate, total_blinks, ear,
-                        ear_threshold, eye_asymmetry, blink_duration, blink_interval,
-                        fatigue_level, drowsiness_score, fps, object_detections, person_tracking
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    metric.session_id, metric.timestamp, metric.emotion,
-                    json.dumps(metric.emotion_scores) if metric.emotion_scores else None,
-                    metric.attention_state, metric.posture_state, metric.movement_level,
-                    metric.blink_rate, metric.total_blinks, metric.ear, metric.ear_threshold,
-                    metric.eye_asymmetry, metric.blink_duration, metric.blink_interval,
-                    metric.fatigue_level, metric.drowsiness_score, metric.fps,
-                    json.dumps(metric.object_detections) if metric.object_detections else None,
-                    json.dumps(metric.person_tracking) if metric.person_tracking else None
-                ))
-                self.conn.commit()
-                return True
-            except sqlite3.OperationalError as e:
-                if "database is locked" in str(e) and attempt < max_retries - 1:
-                    time.sleep(retry_delay * (2 ** attempt))  # Exponential backoff
-                    continue
-                logger.error(f"Error saving video metric: {e}")
-                return False
-            except Exception as e:
-                logger.error(f"Error saving video metric: {e}")
-                return False
-        return False
+        """Queue a video metric; it is written with the next batch (see _buffer_write)"""
+        return self._buffer_write(_INSERT_VIDEO_SQL, self._video_params(metric))
     
     def save_audio_metric(self, metric: AudioMetric) -> bool:
-        """Save an audio metric with retry logic"""
-        max_retries = 3
-        retry_delay = 0.1
-        
-        for attempt in range(max_retries):
-            try:
-                cursor = self.conn.cursor()
-                cursor.execute("""
-                    INSERT INTO audio_metrics (
-                        session_id, timestamp, transcription, emotion, sentiment, confidence,
-                        energy, pitch, speech_rate, silence_ratio, energy_z_score,
-                        pitch_z_score, rate_z_score, chunk_duration, sample_rate, word_count
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    metric.session_id, metric.timestamp, metric.transcription,
-                    metric.emotion, metric.sentiment, metric.confidence,
-                    metric.energy, metric.pitch, metric.speech_rate, metric.silence_ratio,
-                    metric.energy_z_score, metric.pitch_z_score, metric.rate_z_score,
-                    metric.chunk_duration, metric.sample_rate, metric.word_count
-                ))
-                self.conn.commit()
-                return True
-            except sqlite3.OperationalError as e:
-                if "database is locked" in str(e) and attempt < max_retries - 1:
-                    time.sleep(retry_delay * (2 ** attempt))  # Exponential backoff
-                    continue
-                logger.error(f"Error saving audio metric: {e}")
-                return False
-            except Exception as e:
-                logger.error(f"Error saving audio metric: {e}")
-                return False
-        return False
+        """Queue an audio metric; it is written with the next batch (see _buffer_write)"""
+        return self._buffer_write(_INSERT_AUDIO_SQL, self._audio_params(metric))
     
     def save_unified_metric(self, metric: UnifiedMetric) -> bool:
-        """Save a unified metric with retry logic"""
+        """Queue a unified metric; it is written with the next batch (see _buffer_write)"""
+        return self._buffer_write(_INSERT_UNIFIED_SQL, self._unified_params(metric))
+    
+    def save_video_metrics_batch(self, metrics: List[VideoMetric]) -> bool:
+        """Save video metrics in a single transaction"""
+        return self._write_batch(_INSERT_VIDEO_SQL, [self._video_params(m) for m in metrics])
+    
+    def save_audio_metrics_batch(self, metrics: List[AudioMetric]) -> bool:
+        """Save audio metrics in a single transaction"""
+        return self._write_batch(_INSERT_AUDIO_SQL, [self._audio_params(m) for m in metrics])
+    
+    def save_unified_metrics_batch(self, metrics: List[UnifiedMetric]) -> bool:
+        """Save unified metrics in a single transaction"""
+        return self._write_batch(_INSERT_UNIFIED_SQL, [self._unified_params(m) for m in metrics])
+    
+    def _write_batch(self, sql: str, rows: List[tuple]) -> bool:
+        """Insert rows with one executemany() and one commit, with retry logic"""
+        if not rows:
+            return True
         max_retries = 3
         retry_delay = 0.1
         
         for attempt in range(max_retries):
             try:
-                cursor = self.conn.cursor()
-                cursor.execute("""
-                    INSERT INTO unified_metrics (
-                        session_id, timestamp, unified_emotion, unified_attention,
-                        unified_posture, unified_movement, unified_fatigue, unified_sentiment,
-                        unified_confidence, attention_score, engagement_level, stress_indicators,
-                        confidence_level, video_data, audio_data
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    metric.session_id, metric.timestamp, metric.unified_emotion,
-                    metric.unified_attention, metric.unified_posture, metric.unified_movement,
-                    metric.unified_fatigue, metric.unified_sentiment, metric.unified_confidence,
-                    metric.attention_score, metric.engagement_level,
-                    json.dumps(metric.stress_indicators) if metric.stress_indicators else None,
-                    metric.confidence_level,
-                    json.dumps(metric.video_data) if metric.video_data else None,
-                    json.dumps(metric.audio_data) if metric.audio_data else None
-                ))
-                self.conn.commit()
+                with self._write_lock, self.conn:
+                    self.conn.executemany(sql, rows)
                 return True
             except sqlite3.OperationalError as e:
                 if "database is locked" in str(e) and attempt < max_retries - 1:
                     time.sleep(retry_delay * (2 ** attempt))  # Exponential backoff
                     continue
-                logger.error(f"Error saving unified metric: {e}")
+                logger.error(f"Error saving {len(rows)} metrics: {e}")
                 return False
             except Exception as e:
-                logger.error(f"Error saving unified metric: {e}")
+                logger.error(f"Error saving {len(rows)} metrics: {e}")
                 return False
         return False
     
+    def _buffer_write(self, sql: str, params: tuple) -> bool:
+        """Queue one row for the flusher thread
+        
+        A full batch wakes the flusher; only when the writer falls max_pending rows behind
+        does the caller write the backlog itself.
+        
+        Returns:
+            False if the backlog write or the last background batch failed. A True result
+            only means the row was queued; call flush_writes() to know it was written.
+        """
+        with self._buffer_lock:
+            pending = self._pending.setdefault(sql, [])
+            pending.append(params)
+            queued = len(pending)
+            if self._flusher is None:
+                self._flusher = threading.Thread(target=self._flush_loop, name="metrics-db-flush", daemon=True)
+                self._flusher.start()
+        if queued >= self.max_pending:
+            return self.flush_writes()
+        if queued >= self.write_batch_size:
+            self._flush_now.set()
+        return not self._write_failed
+    
+    def _flush_loop(self):
+        """Write out queued rows when a batch fills or every write_flush_interval, until close()"""
+        while not self._closing.is_set():
+            self._flush_now.wait(self.write_flush_interval)
+            self._flush_now.clear()
+            self.flush_writes()
+    
+    def flush_writes(self) -> bool:
+        """Write every queued metric now, one transaction per table
+        
+        A batch that fails is queued again ahead of newer rows so the next flush retries
+        it; rows beyond max_pending per table are dropped (and logged) rather than kept.
+        """
+        if self.conn is None:
+            return True
+        with self._buffer_lock:
+            pending, self._pending = self._pending, {}
+        ok = True
+        for sql, rows in pending.items():
+            if not self._write_batch(sql, rows):
+                ok = False
+                self._requeue(sql, rows)
+                continue
+            if sql is _INSERT_UNIFIED_SQL:
+                # Writes from this process make its cached latest rows stale
+                for row in rows:
+                    self._current_cache.pop(row[0], None)
+        self._write_failed = not ok
+        return ok
+    
+    def _requeue(self, sql: str, rows: List[tuple]):
+        """Put a failed batch back at the front of its table's queue"""
+        with self._buffer_lock:
+            queued = rows + self._pending.get(sql, [])
+            dropped = len(queued) - self.max_pending
+            if dropped > 0:
+                logger.error(f"Write backlog over {self.max_pending} rows, dropping the {dropped} oldest")
+                queued = queued[dropped:]
+            self._pending[sql] = queued
+    
     def get_current_metrics(self, session_id: str) -> Optional[Dict[str, Any]]:
-        """Get the most recent metrics for a session"""
+        """Get the most recent metrics for a session
+        
+        Repeated polls within current_metrics_ttl seconds are answered from memory.
+        """
+        cached = self._current_cache.get(session_id)
+        if cached is not None and cached[0] > time.monotonic():
+            return dict(cached[1])
         try:
-            cursor = self.conn.cursor()
-            
-            # Get latest unified metric
-            cursor.execute("""
-                SELECT * FROM unified_metrics
-                WHERE session_id = ?
-                ORDER BY timestamp DESC
-                LIMIT 1
-            """, (session_id,))
-            
-            unified = cursor.fetchone()
+            with self.read_connection() as conn:
+                # Get latest unified metric
+                unified = conn.execute("""
+                    SELECT * FROM unified_metrics
+                    WHERE session_id = ?
+                    ORDER BY timestamp DESC
+                    LIMIT 1
+                """, (session_id,)).fetchone()
             if unified:
-                # Convert Row to dict
-                return {key: unified[key] for key in unified.keys()}
+                metrics = dict(unified)
+                self._current_cache[session_id] = (time.monotonic() + self.current_metrics_ttl, metrics)
+                return dict(metrics)
             return None
         except Exception as e:
             logger.error(f"Error getting current metrics: {e}")
@@ -333,22 +611,105 @@ class MetricsDatabase:
     def get_metrics_range(self, session_id: str, start_time: float, end_time: float) -> List[Dict[str, Any]]:
         """Get metrics for a time range"""
         try:
-            cursor = self.conn.cursor()
+            with self.read_connection() as conn:
+                cursor = conn.execute("""
+                    SELECT * FROM unified_metrics
+                    WHERE session_id = ? AND timestamp >= ? AND timestamp <= ?
+                    ORDER BY timestamp ASC
+                """, (session_id, start_time, end_time))
+                # Convert rows to dicts as the cursor yields them, without an intermediate list
+                return [dict(row) for row in cursor]
+        except Exception as e:
+            logger.error(f"Error getting metrics range: {e}")
+            return []
+    
+    def iter_metrics_range(self, session_id: str, start_time: float, end_time: float,
+                           batch_size: int = 500) -> Iterator[Dict[str, Any]]:
+        """Iterate over metrics for a time range, fetching rows in batches
+        
+        The query runs immediately, so errors surface to the caller before iteration starts.
+        The pooled read connection is held until the iterator is exhausted or closed.
+        """
+        stack = ExitStack()
+        conn = stack.enter_context(self.read_connection())
+        try:
+            cursor = conn.cursor()
+            cursor.arraysize = batch_size
             cursor.execute("""
                 SELECT * FROM unified_metrics
                 WHERE session_id = ? AND timestamp >= ? AND timestamp <= ?
                 ORDER BY timestamp ASC
             """, (session_id, start_time, end_time))
-            
-            rows = cursor.fetchall()
-            # Convert Row objects to dicts
-            return [{key: row[key] for key in row.keys()} for row in rows]
-        except Exception as e:
-            logger.error(f"Error getting metrics range: {e}")
-            return []
+        except BaseException:
+            stack.close()
+            raise
+        rows = self._iter_rows(cursor, stack)
+        # Step into the with-block so that closing or dropping the iterator returns the connection
+        next(rows)
+        return rows
+    
+    @staticmethod
+    def _iter_rows(cursor: sqlite3.Cursor, stack: ExitStack) -> Iterator[Dict[str, Any]]:
+        """Yield cursor rows as dicts, one fetchmany() batch at a time, then release stack"""
+        with stack:
+            yield None
+            while True:
+                rows = cursor.fetchmany()
+                if not rows:
+                    return
+                for row in rows:
+                    yield dict(row)
+    
+    def checkpoint(self):
+        """Fold the WAL back into the database without waiting on readers or writers"""
+        try:
+            with self._write_lock:
+                return self.conn.execute('PRAGMA wal_checkpoint(PASSIVE)').fetchone()
+        except sqlite3.OperationalError as e:
+            logger.debug(f"WAL checkpoint skipped: {e}")
+            return None
+    
+    @contextmanager
+    def read_connection(self):
+        """Borrow a pooled read connection (the writer connection for in-memory databases)"""
+        if self.read_pool is None:
+            yield self.conn
+            return
+        with self.read_pool.acquire() as conn:
+            yield conn
+    
+    async def fetchall_async(self, sql: str, params: tuple = ()) -> List[sqlite3.Row]:
+        """Run a read query without blocking the event loop
+        
+        Uses the aiosqlite pool when available, otherwise runs the query on a pooled
+        connection in a worker thread.
+        """
+        if self.async_pool is None:
+            return await asyncio.to_thread(self._fetchall_pooled, sql, params)
+        async with self.async_pool.acquire() as conn:
+            return list(await conn.execute_fetchall(sql, params))
+    
+    def _fetchall_pooled(self, sql: str, params: tuple = ()) -> List[sqlite3.Row]:
+        """Run a read query on a pooled connection"""
+        with self.read_connection() as conn:
+            return conn.execute(sql, params).fetchall()
+    
+    async def close_async(self):
+        """Close the async read connections"""
+        if self.async_pool is not None:
+            await self.async_pool.close()
     
     def close(self):
-        """Close database connection"""
+        """Write out queued metrics and close database connection"""
+        self._closing.set()
+        self._flush_now.set()
+        if self._flusher is not None:
+            self._flusher.join()
         if self.conn:
+            self.flush_writes()
             self.conn.close()
+            self.conn = None
+        atexit.unregister(self.flush_writes)
+        if self.read_pool is not None:
+            self.read_pool.close()
 
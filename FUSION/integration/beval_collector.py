@@ -8,6 +8,7 @@ import json
 import logging
 import time
 import sys
+import traceback
 from pathlib import Path
 from typing import Dict, Any, Optional
 import httpx
@@ -164,8 +165,10 @@ class BEVALCollector:
                 person_tracking=video_data.get("person_tracking") or video_data.get("main_person")
             )
             
-            self.db.save_video_metric(metric)
-            logger.debug(f"Saved video metric for session {self.current_session_id}")
+            # Queued for the database's batch writer; False means an earlier batch failed
+            if not self.db.save_video_metric(metric):
+                logger.warning(f"Metric writes are failing for session {self.current_session_id}")
+            logger.debug(f"Queued video metric for session {self.current_session_id}")
         except Exception as e:
             logger.error(f"Error processing video metric: {e}")
     
@@ -199,8 +202,10 @@ class BEVALCollector:
                 word_count=audio_data.get("word_count") or audio_data.get("total_words")
             )
             
-            self.db.save_audio_metric(metric)
-            logger.debug(f"Saved audio metric for session {self.current_session_id}")
+            # Queued for the database's batch writer; False means an earlier batch failed
+            if not self.db.save_audio_metric(metric):
+                logger.warning(f"Metric writes are failing for session {self.current_session_id}")
+            logger.debug(f"Queued audio metric for session {self.current_session_id}")
         except Exception as e:
             logger.error(f"Error processing audio metric: {e}")
     
@@ -252,11 +257,12 @@ class BEVALCollector:
                 audio_data=audio_data
             )
             
-            self.db.save_unified_metric(metric)
-            logger.debug(f"Saved unified metric for session {self.current_session_id}")
+            # Queued for the database's batch writer; False means an earlier batch failed
+            if not self.db.save_unified_metric(metric):
+                logger.warning(f"Metric writes are failing for session {self.current_session_id}")
+            logger.debug(f"Queued unified metric for session {self.current_session_id}")
         except Exception as e:
             logger.error(f"Error processing unified metric: {e}")
-            import traceback
             logger.error(traceback.format_exc())
     
     def _calculate_attention_score(self, unified_state: Dict[str, Any]) -> float:
@@ -3,12 +3,19 @@ Advanced Metrics Processor
 Deep emotional intelligence processing for human-like understanding
 """
 
+import json
 import logging
+import time
 from typing import Dict, List, Any, Optional
-from datetime import datetime, timedelta
 from collections import Counter
 from db.models import MetricsDatabase
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -43,7 +50,7 @@ class MetricsProcessor:
         Get emotionally intelligent context for CONVEI with conversation context
         """
         try:
-            current_time = datetime.now().timestamp()
+            current_time = time.time()
             start_time = current_time - time_window
             
             # Get current metrics
@@ -180,7 +187,8 @@ class MetricsProcessor:
         # Attention pattern
         attention_pattern = 'consistent'
         if len(attention_scores) >= 3:
-            variance = sum((x - sum(attention_scores)/len(attention_scores))**2 for x in attention_scores) / len(attention_scores)
+            mean_attention = sum(attention_scores) / len(attention_scores)
+            variance = sum((x - mean_attention)**2 for x in attention_scores) / len(attention_scores)
             if variance > 400:
                 attention_pattern = 'fluctuating'
             elif attention_scores[-1] < attention_scores[0] - 15:
@@ -189,8 +197,12 @@ class MetricsProcessor:
                 attention_pattern = 'improving'
         
         # Emotional arc (narrative)
-        dominant_first = Counter(emotions[:len(emotions)//2]).most_common(1)
-        dominant_second = Counter(emotions[len(emotions)//2:]).most_common(1)
+        first_counts = Counter(emotions[:len(emotions)//2])
+        second_counts = Counter(emotions[len(emotions)//2:])
+        dominant_first = first_counts.most_common(1)
+        dominant_second = second_counts.most_common(1)
+        # The halves already cover every emotion; summing them avoids a third counting pass
+        emotion_counts = first_counts + second_counts
         
         emotional_arc = 'flat'
         if dominant_first and dominant_second:
@@ -211,7 +223,7 @@ class MetricsProcessor:
             'sentiment_direction': sentiment_direction,
             'attention_pattern': attention_pattern,
             'emotional_arc': emotional_arc,
-            'dominant_emotion': Counter(emotions).most_common(1)[0][0] if emotions else 'neutral',
+            'dominant_emotion': emotion_counts.most_common(1)[0][0] if emotion_counts else 'neutral',
             'emotion_sequence': emotions[-5:] if len(emotions) >= 5 else emotions
         }
     
@@ -498,8 +510,7 @@ class MetricsProcessor:
             video_data = current.get("video_data")
             if isinstance(video_data, str):
                 try:
-                    import json
-                    video_data = json.loads(video_data)
+                    video_data = _json_loads(video_data)
                 except:
                     video_data = None
             
@@ -513,8 +524,7 @@ class MetricsProcessor:
             audio_data = current.get("audio_data")
             if isinstance(audio_data, str):
                 try:
-                    import json
-                    audio_data = json.loads(audio_data)
+                    audio_data = _json_loads(audio_data)
                 except:
                     audio_data = None
             